@@ -39,6 +39,8 @@ interface MovieInfo {
   language?: string
   awards?: string
   poster_omdb?: string
+  image_thumbnail?: string
+  poster_thumbnail?: string
   ratings?: MovieRatings
   box_office?: string
 }
@@ -48,6 +50,7 @@ interface MovieData {
   cinema_id: string
   showtimes: MovieShowtime[]
   scraped_at: string
+  film_id?: string
 }
 
 interface CinemaShowtimes {
@@ -102,16 +105,17 @@ export default function MovieResearchPage() {
     const movieMap = new Map<string, ConsolidatedMovie>()
 
     movies.forEach((movieData) => {
-      const { movie, cinema_id, showtimes } = movieData
-      const movieUrl = movie.url
+      const { movie, cinema_id, showtimes, film_id } = movieData
+      // Same film across cinemas shares a film_id (older data: fall back to the URL)
+      const movieKey = film_id || movie.url
 
-      if (movieMap.has(movieUrl)) {
+      if (movieMap.has(movieKey)) {
         // Add cinema showtimes to existing movie
-        const existing = movieMap.get(movieUrl)!
+        const existing = movieMap.get(movieKey)!
         existing.cinemas.push({ cinema_id, showtimes })
       } else {
         // Create new consolidated movie entry
-        movieMap.set(movieUrl, {
+        movieMap.set(movieKey, {
           movie,
           cinemas: [{ cinema_id, showtimes }],
         })
@@ -204,7 +208,11 @@ export default function MovieResearchPage() {
                           {movie.image_url && (
                             <div className="relative w-full md:w-48 h-64 md:h-auto flex-shrink-0">
                               <Image
-                                src={movie.image_url || "/placeholder.svg"}
+                                src={
+                                  movie.image_thumbnail
+                                    ? getAssetPath(movie.image_thumbnail)
+                                    : movie.image_url || "/placeholder.svg"
+                                }
                                 alt={movie.title}
                                 fill
                                 className="object-cover rounded-md"
@@ -0,0 +1,157 @@
+"""
+Async Fetch - Offline check of the async scraper against a local fixture server
+
+Serves synthetic SIFF-style listing pages from a local HTTP server with an
+artificial per-request latency, then scrapes several cinemas through one
+shared AsyncHTTPClient and compares the result with a sequential
+fetch-and-parse of the same pages. Exits 1 if any cinema's entries differ.
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.async_fetch
+    python -m benchmarks.async_fetch --cinemas 4 --days 7 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import html
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.async_base_scraper import AsyncHTTPClient
+from common.records import RawEntry
+from scrapers.siff.scraper import SIFFHTTPScraper, parse_listing
+from benchmarks.synthetic import film_pool, generate_entries
+
+
+def render_listing(entries: List[RawEntry]) -> str:
+    """One day's entries as a page in the SIFF listing markup"""
+    date_text = html.escape(entries[0].date_text) if entries else ''
+    items = []
+    for entry in entries:
+        buttons = ''.join(f'<a class="button">{html.escape(t)}</a>' for t in entry.showtimes)
+        items.append(
+            '<div class="item">'
+            f'<img src="{html.escape(entry.image_url)}">'
+            f'<h3><a href="{html.escape(entry.url)}">{html.escape(entry.title)}</a></h3>'
+            f'<p class="meta">{html.escape(entry.metadata)}</p>'
+            f'<div class="times"><h3><span class="dark-gray-text">{html.escape(entry.venue)}</span></h3>'
+            f'{buttons}</div>'
+            '</div>'
+        )
+    return (
+        f'<html><body><div class="button-group"><a class="button on">{date_text}</a></div>'
+        f'<div class="listing thumbs">{"".join(items)}</div></body></html>'
+    )
+
+
+def build_site(cinemas: int, days: int, films_per_cinema: int) -> Dict[str, bytes]:
+    """Path ("/c0/?day=3") -> page body for every cinema and day"""
+    pool = film_pool(films_per_cinema * 4)
+    pages = {}
+    for c in range(cinemas):
+        by_day: Dict[int, List[RawEntry]] = {day: [] for day in range(days)}
+        for entry in generate_entries(c, pool, days, films_per_cinema):
+            by_day[entry.day_index].append(entry)
+        for day, entries in by_day.items():
+            pages[f"/c{c}/?day={day}"] = render_listing(entries).encode('utf-8')
+    return pages
+
+
+def start_server(pages: Dict[str, bytes], latency: float) -> ThreadingHTTPServer:
+    """Serve pages on a free local port from a daemon thread"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            parts = urlsplit(self.path)
+            day = parse_qs(parts.query).get('day', ['0'])[0]
+            body = pages.get(f"{parts.path}?day={day}")
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def scrape_sequential(scrapers: List[SIFFHTTPScraper], days: List[int]) -> List[List[RawEntry]]:
+    """Fetch and parse every page one after another (the Selenium-era baseline)"""
+    results = []
+    for scraper in scrapers:
+        entries = []
+        for day in days:
+            with urllib.request.urlopen(scraper.day_url(day), timeout=main_config.ASYNC_TIMEOUT) as response:
+                page = response.read().decode('utf-8')
+            entries.extend(parse_listing(page, day, scraper.calculate_date(day), scraper.base_url))
+        results.append(entries)
+    return results
+
+
+async def scrape_concurrent(scrapers: List[SIFFHTTPScraper], days: List[int]) -> List[List[RawEntry]]:
+    """All cinemas in one event loop through one shared client, as main.py runs them"""
+    async with AsyncHTTPClient() as client:
+        return await asyncio.gather(*(scraper.scrape_all_days_async(client, days) for scraper in scrapers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Async scraper check against a local fixture server')
+    parser.add_argument('--cinemas', type=int, default=3)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--films-per-cinema', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.1, help='Seconds the server waits per request')
+    args = parser.parse_args()
+
+    main_config.VERBOSE = False
+    main_config.ASYNC_REQUEST_DELAY = 0
+
+    pages = build_site(args.cinemas, args.days, args.films_per_cinema)
+    server = start_server(pages, args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    days = list(range(args.days))
+    scrapers = [SIFFHTTPScraper(base_url=f"{base}/c{c}/") for c in range(args.cinemas)]
+
+    try:
+        started = time.perf_counter()
+        expected = scrape_sequential(scrapers, days)
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        actual = asyncio.run(scrape_concurrent(scrapers, days))
+        concurrent = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    print(f"{len(pages)} pages, {args.latency:.2f}s latency each")
+    print(f"  sequential: {sequential:6.2f}s")
+    print(f"  async:      {concurrent:6.2f}s  ({sequential / concurrent:.1f}x)")
+
+    mismatched = [
+        c for c, (scraper, want, got) in enumerate(zip(scrapers, expected, actual))
+        if want != got or scraper.failed_days
+    ]
+    for c in mismatched:
+        print(f"⚠ cinema {c}: {len(actual[c])} entries, expected {len(expected[c])}, "
+              f"failed days {sorted(scrapers[c].failed_days)}")
+    if mismatched or not any(expected):
+        sys.exit(1)
+    print(f"\n✓ {sum(len(e) for e in actual):,} entries, identical to the sequential scrape")
+
+
+if __name__ == "__main__":
+    main()
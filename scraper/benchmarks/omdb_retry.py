@@ -0,0 +1,102 @@
+"""
+OMDb Retry - Offline check that a transient OMDb failure is retried, not fatal
+
+Stubs OMDbClient._get so the first request times out and the retry
+succeeds, then checks the scheduler on its own and a full
+SIFFProcessor.process_movies run (phased and pipelined): the movie must end
+up enriched after exactly one retry. Exits 1 if any check fails.
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.omdb_retry
+"""
+
+from typing import Any, Dict, List
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.film_identity import FilmResolver
+from common.omdb_scheduler import OMDbScheduler, TransientOMDbError
+from common.records import RawEntry
+from scrapers.siff.processor import SIFFProcessor
+
+OMDB_RESPONSE = {
+    "Response": "True", "Title": "Fixture Film", "Year": "2024", "imdbID": "tt0000001",
+    "Plot": "A fixture.", "Genre": "Drama", "imdbRating": "7.0", "Poster": "N/A"
+}
+
+
+def flaky(failures: int):
+    """Request callable failing with a timeout `failures` times, then answering"""
+    calls = []
+
+    def request(*_) -> Dict[str, Any]:
+        calls.append(1)
+        if len(calls) <= failures:
+            raise TransientOMDbError("timeout")
+        return dict(OMDB_RESPONSE)
+    request.calls = calls
+    return request
+
+
+def make_scheduler() -> OMDbScheduler:
+    return OMDbScheduler(daily_budget=100, request_delay=0, sleep=lambda _: None)
+
+
+def run_processor(pipelined: bool) -> List[Any]:
+    """process_movies over one entry, with one timeout before OMDb answers"""
+    main_config.USE_PIPELINED_ENRICHMENT = pipelined
+    processor = SIFFProcessor(use_omdb=True, omdb_scheduler=make_scheduler(), film_resolver=FilmResolver())
+    processor.omdb_client._get = flaky(1)
+    entry = RawEntry.create(
+        title="Fixture Film", url=None, image_url=None, metadata="USA | 2024 | 90 min. | A. Director",
+        venue="SIFF Cinema Uptown", showtimes=["7:00 PM"], show_date="2024-01-01", day_index=0,
+        date_text="Mon, Jan 1"
+    )
+    pipeline = processor.start_enrichment()
+    if pipeline:
+        with pipeline:
+            processor.queue_enrichment([entry])
+    records = processor.process_movies([entry])
+    return records, processor.omdb_client.scheduler.get_stats()
+
+
+def main():
+    main_config.VERBOSE = False
+    failures = []
+
+    def check(ok: bool, message: str):
+        print(f"  {'✓' if ok else '✗'} {message}")
+        if not ok:
+            failures.append(message)
+
+    print("Scheduler:")
+    scheduler = make_scheduler()
+    request = flaky(1)
+    result = scheduler.call(request, description="fixture")
+    check(result == OMDB_RESPONSE, "timeout then success returns the response")
+    check(len(request.calls) == 2 and scheduler.retries == 1,
+          f"{scheduler.retries} retry, {len(request.calls)} attempts")
+    check(scheduler.consecutive_failures == 0, "failure streak reset by the success")
+
+    for pipelined in (False, True):
+        print(f"process_movies ({'pipelined' if pipelined else 'phased'}):")
+        try:
+            records, stats = run_processor(pipelined)
+        except Exception as e:
+            check(False, f"raised {type(e).__name__}: {e}")
+            continue
+        enriched = [record for record in records if record.enrichment.get("imdb_id") == "tt0000001"]
+        check(len(records) == 1 and len(enriched) == 1, "movie enriched after the retry")
+        check(stats["retries"] == 1 and stats["calls_this_run"] == 2,
+              f"{stats['retries']} retry, {stats['calls_this_run']} calls")
+
+    if failures:
+        print(f"\n⚠ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\n✓ Transient OMDb failures are retried")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Poster Fetch - Offline check of the poster pipeline against a local fixture server
+
+Serves three fixture posters from a local HTTP server - two URLs with
+identical bytes and one different image - with ETags, then runs
+PosterPipeline twice over movies pointing at them:
+
+    1st run: originals stored once per sha256, thumbnails built, movies linked
+    2nd run: every poster answered 304 Not Modified, nothing downloaded
+
+Exits 1 if any check fails. Requires Pillow (thumbnails) and requests.
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.poster_fetch
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.poster_pipeline import PosterPipeline
+from common.records import MovieRecord
+
+
+def fixture_png(width: int, height: int, rgb: Tuple[int, int, int]) -> bytes:
+    """A solid-colour PNG, built without Pillow so fixtures never depend on it"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    row = b'\x00' + bytes(rgb) * width
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(row * height))
+        + chunk(b'IEND', b'')
+    )
+
+
+def start_server(images: Dict[str, bytes], responses: Counter) -> ThreadingHTTPServer:
+    """Serve images with strong ETags on a free local port; responses counts status codes"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = images.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get('If-None-Match') == etag:
+                responses[304] += 1
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            responses[200] += 1
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_records(base: str, paths: List[str]) -> List[MovieRecord]:
+    """One movie per poster URL (distinct titles, so no film shares a poster URL)"""
+    return [
+        MovieRecord(
+            title=f"Fixture Film {i}", url=None, image_url=f"{base}{path}", country=None,
+            year=2024, duration=None, director=None, cinema_id="FIXTURE", showtimes=[],
+            scraped_at="2024-01-01"
+        )
+        for i, path in enumerate(paths)
+    ]
+
+
+def read_bytes(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def run_once(base: str, paths: List[str], root: str) -> Tuple[PosterPipeline, List[MovieRecord]]:
+    """A fresh pipeline (as a new run would create), run over the fixture movies"""
+    pipeline = PosterPipeline(
+        output_dir=root,
+        thumbnail_dir=os.path.join(root, "thumbnails"),
+        cache_dir=os.path.join(root, "cache"),
+        public_path="/posters"
+    )
+    records = make_records(base, paths)
+    pipeline.run(records)
+    pipeline.save()
+    return pipeline, records
+
+
+def main():
+    main_config.VERBOSE = False
+
+    shared = fixture_png(600, 900, (200, 30, 40))
+    images = {
+        "/a.png": shared,
+        "/b.png": shared,
+        "/c.png": fixture_png(600, 900, (20, 90, 200)),
+    }
+    hashes = {hashlib.sha256(body).hexdigest() for body in images.values()}
+    paths = sorted(images)
+
+    responses = Counter()
+    server = start_server(images, responses)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    failures = []
+
+    def check(ok: bool, message: str):
+        print(f"  {'✓' if ok else '✗'} {message}")
+        if not ok:
+            failures.append(message)
+
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            print("First run:")
+            pipeline, records = run_once(base, paths, root)
+            stats = pipeline.get_stats()
+            originals = [
+                name for _, _, names in os.walk(os.path.join(root, "cache")) for name in names
+            ]
+            stored = {name.split('.')[0] for name in originals}
+            check(len(originals) == len(hashes) and stored == hashes,
+                  f"{len(originals)} originals stored for {len(images)} URLs, named by sha256")
+            check(all(
+                hashlib.sha256(read_bytes(pipeline._find_original(h))).hexdigest() == h for h in stored
+            ), "stored originals match their hash")
+            thumbnail_dir = os.path.join(root, "thumbnails")
+            thumbnails = os.listdir(thumbnail_dir) if os.path.isdir(thumbnail_dir) else []
+            check(len(thumbnails) == len(hashes), f"{len(thumbnails)} thumbnails built")
+            linked = [record.images.get("image_thumbnail") for record in records]
+            check(all(linked) and linked[0] == linked[1] != linked[2],
+                  "movies linked to thumbnails (identical posters share one)")
+            print(f"    stats: {stats}")
+
+            print("Second run:")
+            served = responses[200]
+            pipeline, records = run_once(base, paths, root)
+            stats = pipeline.get_stats()
+            check(responses[304] == len(images), f"{responses[304]} conditional requests answered 304")
+            check(responses[200] == served and not stats.get('downloaded'), "nothing downloaded again")
+            check(stats.get('unchanged') == len(images), f"{stats.get('unchanged', 0)} posters unchanged")
+            check(all(record.images.get("image_thumbnail") for record in records),
+                  "movies still linked to thumbnails")
+    finally:
+        server.shutdown()
+
+    if failures:
+        print(f"\n⚠ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\n✓ Poster pipeline OK")
+
+
+if __name__ == "__main__":
+    main()
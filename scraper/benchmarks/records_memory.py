@@ -0,0 +1,106 @@
+"""
+Records Memory Benchmark - Compare dict entries with compact interned records
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.records_memory
+    python -m benchmarks.records_memory --entries 200000 --titles 800
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.records import RawEntry, Showtime
+
+VENUES = ["SIFF Cinema Uptown", "SIFF Cinema Downtown", "SIFF Film Center", "SIFF Cinema Egyptian"]
+TIMES = ["11:30 AM", "1:15 PM", "3:45 PM", "6:30 PM", "7:00 PM", "9:15 PM"]
+
+
+def synthetic_fields(entries: int, titles: int, days: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """
+    Field values for a synthetic catalog
+
+    Strings are rebuilt for every entry (as they are when parsed out of HTML),
+    so identical values are distinct objects unless something interns them.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(entries):
+        t = rng.randrange(titles)
+        venue = VENUES[t % len(VENUES)]
+        day = i % days
+        rows.append({
+            'title': f"Synthetic Film {t}",
+            'url': f"https://www.siff.net/cinema/in-theaters/synthetic-film-{t}",
+            'image_url': f"https://www.siff.net/images/CINEMA/2025/Synthetic_{t}_1600x900.jpg",
+            'metadata': f"USA | {1950 + t % 75} | {80 + t % 90} min. | Director {t % 300}",
+            'venue': ''.join(venue),
+            'showtimes': [''.join(x) for x in rng.sample(TIMES, 3)],
+            'show_date': f"2025-11-{1 + day:02d}",
+            'day_index': day,
+            'date_text': f"Day {day}"
+        })
+    return rows
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the structure build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    data = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Raw/processed record memory benchmark')
+    parser.add_argument('--entries', type=int, default=50000, help='Raw entries to generate')
+    parser.add_argument('--titles', type=int, default=500, help='Distinct titles')
+    parser.add_argument('--days', type=int, default=30, help='Distinct show dates')
+    args = parser.parse_args()
+
+    print(f"Synthetic catalog: {args.entries:,} raw entries, {args.titles} titles, {args.days} days")
+
+    raw_dicts = measure(lambda: synthetic_fields(args.entries, args.titles, args.days))
+    raw_records = measure(lambda: [
+        RawEntry.create(**row) for row in synthetic_fields(args.entries, args.titles, args.days)
+    ])
+
+    def showtime_dicts():
+        return [
+            {"show_date": row['show_date'], "show_time": f"{10 + i % 12}:{i % 60:02d}"}
+            for row in synthetic_fields(args.entries, args.titles, args.days)
+            for i in range(len(row['showtimes']))
+        ]
+
+    def showtime_records():
+        table = {}
+        showtimes = []
+        for row in synthetic_fields(args.entries, args.titles, args.days):
+            show_date = sys.intern(row['show_date'])
+            for i in range(len(row['showtimes'])):
+                time_str = f"{10 + i % 12}:{i % 60:02d}"
+                showtimes.append(Showtime(show_date, table.setdefault(time_str, time_str)))
+        return showtimes
+
+    st_dicts = measure(showtime_dicts)
+    st_records = measure(showtime_records)
+
+    print(f"{'':24}{'dicts':>12}{'records':>12}{'saved':>8}")
+    for label, before, after in (
+        ("Raw entries", raw_dicts, raw_records),
+        ("Showtimes", st_dicts, st_records)
+    ):
+        saved = 100 * (1 - after / before) if before else 0
+        print(f"{label:24}{before / 2**20:>10.1f}MB{after / 2**20:>10.1f}MB{saved:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
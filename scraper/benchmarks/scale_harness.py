@@ -0,0 +1,194 @@
+"""
+Scale Harness - Time and peak memory of the processing pipeline as the catalog grows
+
+Runs SIFFProcessor.process_movies (with film resolution and a stubbed OMDb
+client), the per-cinema writes and generate_combined_output over synthetic
+catalogs of increasing size, then fits how each stage grows with the number
+of raw entries. A stage whose log-log slope is above SUPERLINEAR_SLOPE is
+flagged: it will get disproportionately slower as cinemas are added.
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.scale_harness
+    python -m benchmarks.scale_harness --cinemas 1 5 10 25 50 --days 30
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import math
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.film_identity import FilmResolver
+from common.omdb_scheduler import OMDbScheduler
+from common.records import to_dicts
+from scrapers.siff.processor import SIFFProcessor
+from benchmarks.synthetic import film_pool, generate_entries, venue_map
+import main as pipeline
+
+# Growth exponent above which a stage is reported as worse than linear
+SUPERLINEAR_SLOPE = 1.15
+
+# Stages faster than this at the largest scale are too noisy to judge
+MIN_FLAG_SECONDS = 0.05
+
+STAGES = ("process", "write", "combine")
+
+
+class StubOMDbClient:
+    """Answers every lookup instantly with canned data (no network, no budget)"""
+
+    def __init__(self):
+        self.scheduler = OMDbScheduler(daily_budget=10**9, request_delay=0, sleep=lambda _: None)
+        self.lookups = 0
+
+    def get_enrichment(self, title: str, year: Optional[int] = None) -> Dict[str, Any]:
+        self.lookups += 1
+        return {
+            "imdb_id": f"tt{self.lookups:07d}",
+            "plot": "A synthetic plot.",
+            "genre": "Drama",
+            "ratings": {"imdb_rating": "7.1"}
+        }
+
+    def is_cached(self, title: str, year: Optional[int] = None) -> bool:
+        return True
+
+
+def run_pipeline(catalog: List[List[Any]], output_dir: str) -> Dict[str, Callable[[], Any]]:
+    """
+    Stage callables for one catalog; each stage consumes the previous one's result
+
+    Returns:
+        Ordered mapping of stage name -> callable
+    """
+    state = {}
+
+    def process():
+        resolver = FilmResolver()
+        state["results"] = []
+        for cinema_index, raw_data in enumerate(catalog):
+            processor = SIFFProcessor(use_omdb=True, film_resolver=resolver)
+            processor.cinema_venues = venue_map(cinema_index)
+            processor.omdb_client = StubOMDbClient()
+            records = processor.process_movies(raw_data)
+            state["results"].append({
+                "scraper": f"cinema{cinema_index}",
+                "status": "success",
+                "data": records
+            })
+
+    def write():
+        for result in state["results"]:
+            pipeline.save_json(to_dicts(result["data"]), f"{result['scraper']}_movies.json", output_dir)
+
+    def combine():
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline.generate_combined_output(state["results"], output_dir)
+
+    return {"process": process, "write": write, "combine": combine}
+
+
+def measure_stages(catalog: List[List[Any]], track_memory: bool) -> Dict[str, Tuple[float, Optional[int]]]:
+    """
+    Run all stages twice: once timed, once under tracemalloc for peak memory
+
+    Returns:
+        Stage name -> (seconds, peak bytes or None)
+    """
+    measurements = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for stage, run in run_pipeline(catalog, output_dir).items():
+            gc.collect()
+            started = time.perf_counter()
+            run()
+            measurements[stage] = (time.perf_counter() - started, None)
+
+        if track_memory:
+            for stage, run in run_pipeline(catalog, output_dir).items():
+                gc.collect()
+                tracemalloc.start()
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                measurements[stage] = (measurements[stage][0], peak)
+    return measurements
+
+
+def growth_slope(sizes: List[int], values: List[float]) -> Optional[float]:
+    """Least-squares slope of log(value) against log(size); 1.0 means linear"""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v and v > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Processing pipeline scale harness')
+    parser.add_argument('--cinemas', type=int, nargs='+', default=[1, 2, 5, 10, 20],
+                        help='Catalog sizes to run, in cinemas')
+    parser.add_argument('--days', type=int, default=30, help='Show days per cinema')
+    parser.add_argument('--films', type=int, default=2000, help='Films in the shared pool')
+    parser.add_argument('--films-per-cinema', type=int, default=200)
+    parser.add_argument('--skew', type=float, default=1.1, help='Zipf exponent of film popularity')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    args = parser.parse_args()
+
+    # Per-title progress lines would dominate the timings
+    main_config.VERBOSE = False
+
+    pool = film_pool(args.films, args.skew)
+    sizes, rows = [], []
+    print(f"{'cinemas':>8}{'entries':>10}" + ''.join(f"{s + ' s':>12}{s + ' MB':>12}" for s in STAGES))
+    for cinemas in sorted(args.cinemas):
+        catalog = [
+            list(generate_entries(c, pool, args.days, args.films_per_cinema))
+            for c in range(cinemas)
+        ]
+        entries = sum(len(raw_data) for raw_data in catalog)
+        measurements = measure_stages(catalog, track_memory=not args.no_memory)
+        sizes.append(entries)
+        rows.append(measurements)
+
+        line = f"{cinemas:>8}{entries:>10,}"
+        for stage in STAGES:
+            seconds, peak = measurements[stage]
+            line += f"{seconds:>12.3f}" + (f"{peak / 2**20:>12.1f}" if peak is not None else f"{'-':>12}")
+        print(line, flush=True)
+
+    print(f"\nGrowth with raw entries (1.0 = linear, flagged above {SUPERLINEAR_SLOPE}):")
+    flagged = []
+    for stage in STAGES:
+        times = [row[stage][0] for row in rows]
+        peaks = [row[stage][1] for row in rows]
+        for metric, values in (("time", times), ("memory", peaks)):
+            slope = growth_slope(sizes, values)
+            if slope is None:
+                continue
+            noisy = metric == "time" and max(times) < MIN_FLAG_SECONDS
+            flag = slope > SUPERLINEAR_SLOPE and not noisy
+            if flag:
+                flagged.append(f"{stage} {metric}")
+            note = "  ⚠ worse than linear" if flag else ("  (too fast to judge)" if noisy else "")
+            print(f"  {stage:<8} {metric:<7} {slope:5.2f}{note}")
+
+    if flagged:
+        print(f"\n⚠ Superlinear: {', '.join(flagged)}")
+        sys.exit(1)
+    print("\n✓ All stages scale linearly")
+
+
+if __name__ == "__main__":
+    main()
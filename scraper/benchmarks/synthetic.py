@@ -0,0 +1,199 @@
+"""
+Synthetic Catalog - Realistic raw-entry streams at configurable scale
+
+A shared pool of films is shown by many cinemas. Film popularity follows a
+Zipf-like curve, so a few titles are on at most cinemas on most days while
+the long tail appears once or twice. Each cinema spells titles its own way
+("The X" / "X, The", accents, "(2024)" suffixes), has several venues, and
+lists times in the formats seen on real sites, plus the odd unparseable one.
+
+Usage (from the scraper/ folder):
+    python -m benchmarks.synthetic --cinemas 3 --days 7
+"""
+
+import argparse
+import random
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, NamedTuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.records import RawEntry
+
+WORDS = [
+    "night", "river", "house", "summer", "last", "blue", "city", "ghost", "letter", "winter",
+    "garden", "stranger", "mirror", "road", "silent", "island", "daughter", "fire", "dream",
+    "north", "glass", "wolf", "harbor", "echo", "salt", "paper", "velvet", "storm", "orchard",
+    "station", "lantern", "hollow", "crown", "tide", "ember", "meadow", "signal", "atlas"
+]
+ACCENTED = {"e": "é", "a": "á", "o": "ö"}
+COUNTRIES = ["USA", "France", "Japan", "South Korea", "UK", "Germany", "Mexico", "Iran", "Canada", "Italy"]
+VENUE_KINDS = ["Cinema", "Theatre", "Film Center", "Screening Room", "Playhouse"]
+
+# Listed times: (weight, format); "{h}" is the 12-hour hour, "{m}" the minutes
+TIME_FORMATS = [
+    (70, "{h}:{m} PM"),
+    (10, "{h}:{m}PM"),
+    (8, "{h}:{m} p.m."),
+    (6, "{h}:{m} pm"),
+    (3, "{h}:{m}  PM"),
+    (2, "TBA"),
+    (1, "Sold Out")
+]
+SLOTS = [(11, 0), (12, 30), (1, 15), (2, 45), (4, 0), (5, 30), (6, 45), (7, 0), (8, 15), (9, 30), (10, 0)]
+
+
+class SyntheticFilm(NamedTuple):
+    title: str
+    year: int
+    duration: int
+    director: str
+    country: str
+    weight: float
+
+
+def film_pool(films: int, skew: float = 1.1, seed: int = 1) -> List[SyntheticFilm]:
+    """
+    Films shared by all cinemas, most popular first
+
+    Args:
+        films: Pool size
+        skew: Zipf exponent of popularity (0 = uniform)
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    pool = []
+    for rank in range(films):
+        words = rng.sample(WORDS, rng.choice((1, 2, 2, 3)))
+        title = ' '.join(w.capitalize() for w in words)
+        if rng.random() < 0.3:
+            title = f"The {title}"
+        title = f"{title} {rank}" if rank >= len(WORDS) else title
+        pool.append(SyntheticFilm(
+            title=title,
+            year=rng.randint(1950, 2025),
+            duration=rng.randint(75, 180),
+            director=f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS).capitalize()}son",
+            country=rng.choice(COUNTRIES),
+            weight=1 / (rank + 1) ** skew
+        ))
+    return pool
+
+
+def cinema_title(film: SyntheticFilm, style: int) -> str:
+    """The film's title as one cinema lists it"""
+    title = film.title
+    if style == 1 and title.startswith("The "):
+        return f"{title[4:]}, The"
+    if style == 2:
+        return ''.join(ACCENTED.get(c, c) if i == 1 else c for i, c in enumerate(title))
+    if style == 3:
+        return f"{title} ({film.year})"
+    return title
+
+
+def listed_time(rng: random.Random, slot) -> str:
+    """One showtime string in a randomly chosen listing format"""
+    hour, minute = slot
+    template = rng.choices([f for _, f in TIME_FORMATS], weights=[w for w, _ in TIME_FORMATS])[0]
+    text = template.format(h=hour, m=f"{minute:02d}")
+    if hour in (10, 11):  # Morning slots
+        text = text.replace("PM", "AM").replace("p.m.", "a.m.").replace("pm", "am")
+    return text
+
+
+def generate_entries(
+    cinema_index: int,
+    pool: List[SyntheticFilm],
+    days: int = 30,
+    films_per_cinema: int = 200,
+    venues: int = 3,
+    start: date = None,
+    seed: int = 1
+) -> Iterator[RawEntry]:
+    """
+    Raw entries for one cinema, day by day (as the scraper would yield them)
+
+    Args:
+        cinema_index: Which cinema (selects its lineup, venues and title style)
+        pool: Output of film_pool()
+        days: Show days
+        films_per_cinema: Films in the cinema's lineup
+        venues: Venues per cinema
+        start: First show date (defaults to today)
+        seed: Random seed
+    """
+    rng = random.Random(seed * 1_000_003 + cinema_index)
+    start = start or date.today()
+    style = cinema_index % 4
+    venue_names = [f"Cinema {cinema_index} {VENUE_KINDS[v % len(VENUE_KINDS)]} {v}" for v in range(venues)]
+
+    # Weighted sample without replacement: popular films are in most lineups
+    lineup = sorted(
+        pool,
+        key=lambda film: rng.random() ** (1 / film.weight),
+        reverse=True
+    )[:films_per_cinema]
+    top_weight = max(film.weight for film in lineup)
+
+    for day in range(days):
+        show_date = (start + timedelta(days=day)).strftime('%Y-%m-%d')
+        date_text = (start + timedelta(days=day)).strftime('%a, %b %-d')
+        for film in lineup:
+            # Popular films play most days, the tail now and then
+            if rng.random() > 0.15 + 0.85 * (film.weight / top_weight) ** 0.3:
+                continue
+            title = cinema_title(film, style)
+            metadata = f"{film.country} | {film.year} | {film.duration} min. | {film.director}"
+            if rng.random() < 0.02:
+                metadata = f"{film.country} | n/a | runtime tbc | {film.director}"
+            slug = title.lower().replace(' ', '-')
+            for venue in rng.sample(venue_names, rng.choice((1, 1, 1, 2))):
+                slots = sorted(rng.sample(SLOTS, rng.randint(1, 4)))
+                yield RawEntry.create(
+                    title=title,
+                    url=f"https://cinema{cinema_index}.example.org/films/{slug}",
+                    image_url=f"https://cinema{cinema_index}.example.org/images/{slug}.jpg",
+                    metadata=metadata,
+                    venue=venue,
+                    showtimes=[listed_time(rng, slot) for slot in slots],
+                    show_date=show_date,
+                    day_index=day,
+                    date_text=date_text
+                )
+
+
+def venue_map(cinema_index: int, venues: int = 3) -> Dict[str, str]:
+    """Venue name -> cinema ID, for a processor's cinema_venues"""
+    return {
+        f"Cinema {cinema_index} {VENUE_KINDS[v % len(VENUE_KINDS)]} {v}": f"CINEMA_{cinema_index}_VENUE_{v}"
+        for v in range(venues)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Print a summary of a synthetic catalog')
+    parser.add_argument('--cinemas', type=int, default=3)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--films', type=int, default=1000, help='Films in the shared pool')
+    parser.add_argument('--films-per-cinema', type=int, default=200)
+    parser.add_argument('--skew', type=float, default=1.1)
+    args = parser.parse_args()
+
+    pool = film_pool(args.films, args.skew)
+    titles, times, entries = Counter(), Counter(), 0
+    for cinema in range(args.cinemas):
+        for entry in generate_entries(cinema, pool, args.days, args.films_per_cinema):
+            entries += 1
+            titles[entry.title] += 1
+            times.update(entry.showtimes)
+
+    print(f"{entries:,} raw entries, {len(titles):,} distinct titles")
+    print("Most listed:", ', '.join(f"{t} ({n})" for t, n in titles.most_common(3)))
+    print("Time formats:", ', '.join(repr(t) for t, _ in times.most_common(8)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Async Base Scraper - Shared functionality for cinemas whose listings are plain HTTP pages
+
+Cinemas that do not need a browser fetch their pages through one shared
+AsyncHTTPClient (aiohttp): pooled connections, a concurrency limit per host,
+timeouts and retries. HTML is parsed in a process pool so the event loop
+keeps fetching while pages are parsed. main.py runs all of these cinemas in
+one event loop, in a background thread next to the Selenium-based ones.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.checkpoint import CheckpointStore
+from common.refresh_scheduler import RefreshScheduler
+from common.records import RawEntry
+
+
+class AsyncHTTPClient:
+    """
+    One aiohttp session and parse pool shared by all async cinemas of a run
+
+    Usage:
+        async with AsyncHTTPClient() as client:
+            html = await client.get_text(url)
+            entries = await client.parse(parse_listing, html, ...)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = None,
+        per_host: int = None,
+        timeout: float = None,
+        retries: int = None,
+        parse_workers: int = None
+    ):
+        """
+        Initialize client (the session is opened by `async with`)
+
+        Args:
+            max_connections: Connection pool size across all hosts
+            per_host: Concurrent requests allowed per host
+            timeout: Seconds per request
+            retries: Retries for timeouts, connection errors and 5xx
+            parse_workers: Processes used for parsing (0 = parse in a thread)
+        """
+        self.max_connections = max_connections or main_config.ASYNC_MAX_CONNECTIONS
+        self.per_host = per_host or main_config.ASYNC_PER_HOST_LIMIT
+        self.timeout = timeout or main_config.ASYNC_TIMEOUT
+        self.retries = retries if retries is not None else main_config.ASYNC_RETRIES
+        self.parse_workers = parse_workers if parse_workers is not None else main_config.ASYNC_PARSE_WORKERS
+        self.session = None
+        self.pool = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.stats = Counter()
+
+    async def __aenter__(self) -> 'AsyncHTTPClient':
+        # Imported here so Selenium-only and offline runs don't need aiohttp
+        import aiohttp
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': main_config.USER_AGENT}
+        )
+        # spawn: the loop runs in a thread next to Selenium, and forking a threaded process is unsafe
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) if self.parse_workers else None
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        if self.pool:
+            self.pool.shutdown(wait=True)
+
+    async def get_text(self, url: str) -> str:
+        """
+        Fetch a page, waiting for a free slot on its host
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError once retries are used up
+        """
+        import aiohttp
+
+        host = urlsplit(url).netloc
+        limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with limit:
+            for attempt in range(self.retries + 1):
+                try:
+                    async with self.session.get(url) as response:
+                        if response.status >= 500 and attempt < self.retries:
+                            raise aiohttp.ClientResponseError(
+                                response.request_info, response.history, status=response.status
+                            )
+                        response.raise_for_status()
+                        text = await response.text()
+                    self.stats['requests'] += 1
+                    self.stats['bytes'] += len(text)
+                    # Politeness delay, per host (other hosts keep going)
+                    await asyncio.sleep(main_config.ASYNC_REQUEST_DELAY)
+                    return text
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status = getattr(e, 'status', None)
+                    retryable = status is None or status >= 500
+                    if not retryable or attempt == self.retries:
+                        self.stats['failed'] += 1
+                        raise
+                    self.stats['retries'] += 1
+                    await asyncio.sleep(min(2 ** attempt, 10))
+
+    async def parse(self, func: Callable[..., Any], *args) -> Any:
+        """Run func(*args) in the parse pool (func must be picklable, e.g. module-level)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, functools.partial(func, *args))
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+
+class AsyncBaseScraper:
+    """
+    Base class for cinemas fetched over plain HTTP
+
+    Child classes implement day_url() and parse_day(). parse_day runs in a
+    worker process, so it must be a staticmethod using only its arguments.
+    """
+
+    def __init__(self, config: Dict[str, Any], base_url: str = None):
+        """
+        Initialize async scraper
+
+        Args:
+            config: The cinema's entry in cinemas.py (name, base_url, days_to_scrape)
+            base_url: Overrides config's base_url (e.g. a local fixture server)
+        """
+        self.config = config
+        self.cinema_name = config['name']
+        self.base_url = base_url or config['base_url']
+        self.failed_days = set()
+
+    def day_url(self, day_index: int) -> str:
+        """URL of the listing for one day; must be implemented by child classes"""
+        raise NotImplementedError("Child class must implement day_url()")
+
+    @staticmethod
+    def parse_day(html_content: str, day_index: int, show_date: str, base_url: str) -> List[RawEntry]:
+        """Parse one day's listing (runs in a worker process); must be implemented by child classes"""
+        raise NotImplementedError("Child class must implement parse_day()")
+
+    def calculate_date(self, day_index: int) -> str:
+        """Date string (YYYY-MM-DD) of a day index (0 = today)"""
+        return (datetime.now() + timedelta(days=day_index)).strftime('%Y-%m-%d')
+
+    def cleanup(self):
+        """Nothing to release; the shared client is closed by its owner"""
+
+    async def scrape_day(self, client: AsyncHTTPClient, day_index: int) -> List[RawEntry]:
+        """Fetch and parse one day; failures are recorded in failed_days"""
+        try:
+            if main_config.VERBOSE:
+                print(f"  [{self.cinema_name}] Fetching day {day_index}...")
+            html_content = await client.get_text(self.day_url(day_index))
+            entries = await client.parse(
+                type(self).parse_day, html_content, day_index, self.calculate_date(day_index), self.base_url
+            )
+            # Strings lose their interning when sent back from the worker process
+            return [RawEntry.create(*entry) for entry in entries]
+        except Exception as e:
+            print(f"    [{self.cinema_name}] Error scraping day {day_index}: {e}")
+            self.failed_days.add(day_index)
+            return []
+
+    async def scrape_all_days_async(
+        self,
+        client: AsyncHTTPClient,
+        days: List[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh: Optional[RefreshScheduler] = None,
+        on_day: Optional[Callable[[List[RawEntry]], None]] = None
+    ) -> List[RawEntry]:
+        """
+        Scrape all days concurrently (same checkpoint/refresh rules as SIFFScraper)
+
+        Args:
+            client: Shared HTTP client
+            days: List of day indices. If None, uses config
+            checkpoint: If given, finished days are saved and days already
+                        finished by this run are not fetched again
+            refresh: If given (requires checkpoint), only planned days are
+                     fetched; the rest are served from their last snapshot
+            on_day: Called (on the loop's thread) with each day's entries as
+                    soon as they are available
+
+        Returns:
+            List of all raw movie data, in day order
+        """
+        if days is None:
+            days = self.config['days_to_scrape']
+
+        to_fetch = set(days)
+        if refresh and checkpoint:
+            to_fetch = set(refresh.plan(days, self.calculate_date, checkpoint.has_snapshot))
+
+        by_day: Dict[int, List[RawEntry]] = {}
+        pending = []
+        for day in days:
+            show_date = self.calculate_date(day)
+            if checkpoint:
+                saved = checkpoint.load_day(show_date)
+                if saved is None and day not in to_fetch:
+                    saved = checkpoint.load_snapshot(show_date)
+                    if saved is not None and refresh:
+                        refresh.record_reuse(show_date)
+                if saved is not None:
+                    by_day[day] = [entry._replace(day_index=day) for entry in saved]
+                    if on_day:
+                        on_day(by_day[day])
+                    continue
+            pending.append(day)
+
+        async def fetch(day: int):
+            started = time.monotonic()
+            entries = await self.scrape_day(client, day)
+            if on_day:
+                on_day(entries)
+            return day, entries, time.monotonic() - started
+
+        for day, entries, duration in await asyncio.gather(*(fetch(day) for day in pending)):
+            by_day[day] = entries
+            # Failed days are left unsaved so --resume retries them
+            if day not in self.failed_days:
+                show_date = self.calculate_date(day)
+                if checkpoint:
+                    checkpoint.save_day(day, show_date, entries)
+                if refresh:
+                    refresh.record_fetch(show_date, entries, duration)
+
+        if main_config.VERBOSE:
+            fetched = len(pending) - len(self.failed_days)
+            print(f"  [{self.cinema_name}] {fetched} days fetched, {len(days) - len(pending)} from checkpoint")
+
+        return [entry for day in days for entry in by_day.get(day, [])]
+
+    def scrape_all_days(
+        self,
+        days: List[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh: Optional[RefreshScheduler] = None,
+        on_day: Optional[Callable[[List[RawEntry]], None]] = None
+    ) -> List[RawEntry]:
+        """Blocking entry point with a client of its own (main.py shares one instead)"""
+        async def run():
+            async with AsyncHTTPClient() as client:
+                return await self.scrape_all_days_async(client, days, checkpoint, refresh, on_day)
+        return asyncio.run(run())
@@ -3,13 +3,19 @@ Base Processor - Shared data processing functionality
 """
 
 import re
-from typing import Dict, Any, Optional
-from datetime import datetime
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional, Tuple
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import main_config
+from common.records import RawEntry
+
+# Compiled once; used for every distinct string
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+DURATION_PATTERN = re.compile(r'(\d+)\s*min')
+TIME_PATTERN = re.compile(r'^\s*(\d{1,2}):(\d{2})\s*([AaPp])\.?\s*[Mm]\.?\s*$')
 
 
 class BaseProcessor:
@@ -23,10 +29,54 @@ class BaseProcessor:
             cinema_venues: Mapping of venue names to cinema IDs
         """
         self.cinema_venues = cinema_venues
+        
+        # Lookup tables: each distinct string is parsed once per processor
+        self._time_table: Dict[str, Optional[str]] = {}
+        self._metadata_table: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = {}
+        
+        # Occurrences that could not be parsed, by kind ("time", "year", "duration")
+        self.parse_failures = Counter()
+    
+    def normalize_batch(
+        self,
+        raw_data: Iterable[RawEntry]
+    ) -> Tuple[Dict[str, Optional[str]], Dict[str, Dict[str, Any]]]:
+        """
+        Parse all showtime and metadata strings of a batch in one pass
+        
+        Distinct strings are collected first and each one is parsed once, so
+        the cost grows with the number of different values rather than with
+        the number of showtimes.
+        
+        Args:
+            raw_data: Raw entries
+            
+        Returns:
+            (time table, metadata table): raw string -> parsed value
+        """
+        time_counts = Counter()
+        metadata_counts = Counter()
+        for entry in raw_data:
+            time_counts.update(entry.showtimes)
+            metadata_counts[entry.metadata] += 1
+        
+        times = {}
+        for time_str, count in time_counts.items():
+            times[time_str] = self._lookup_time(time_str)
+            if times[time_str] is None:
+                self.parse_failures['time'] += count
+        
+        metadata = {}
+        for metadata_str, count in metadata_counts.items():
+            metadata[metadata_str], failed = self._lookup_metadata(metadata_str)
+            for kind in failed:
+                self.parse_failures[kind] += count
+        
+        return times, metadata
     
     def parse_metadata(self, metadata: str) -> Dict[str, Any]:
         """
-        Parse metadata string into structured data
+        Parse metadata string into structured data (memoized)
         
         Example: "USA | 2025 | 119 min. | Joachim Rønning"
         
@@ -38,15 +88,35 @@ class BaseProcessor:
                 "director": "Joachim Rønning"
             }
         """
+        parsed, failed = self._lookup_metadata(metadata)
+        for kind in failed:
+            self.parse_failures[kind] += 1
+        return dict(parsed)
+    
+    def _lookup_metadata(self, metadata: str) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """Table lookup for parse_metadata (does not count failures)"""
+        if metadata not in self._metadata_table:
+            self._metadata_table[metadata] = self._parse_metadata(metadata)
+        return self._metadata_table[metadata]
+    
+    @staticmethod
+    def _parse_metadata(metadata: str) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """
+        Parse one metadata string
+        
+        Returns:
+            (parsed fields, names of fields present but unparseable)
+        """
         result = {
             "country": None,
             "year": None,
             "duration": None,
             "director": None
         }
+        failed = []
         
         if not metadata:
-            return result
+            return result, ()
         
         # Split by pipe
         parts = [p.strip() for p in metadata.split('|')]
@@ -56,20 +126,24 @@ class BaseProcessor:
         
         if len(parts) >= 2:
             # Try to extract year
-            year_match = re.search(r'\b(19|20)\d{2}\b', parts[1])
+            year_match = YEAR_PATTERN.search(parts[1])
             if year_match:
                 result['year'] = int(year_match.group())
+            else:
+                failed.append('year')
         
         if len(parts) >= 3:
             # Try to extract duration (minutes)
-            duration_match = re.search(r'(\d+)\s*min', parts[2])
+            duration_match = DURATION_PATTERN.search(parts[2])
             if duration_match:
                 result['duration'] = int(duration_match.group(1))
+            else:
+                failed.append('duration')
         
         if len(parts) >= 4:
             result['director'] = parts[3]
         
-        return result
+        return result, tuple(failed)
     
     def convert_time_to_24h(self, time_str: str) -> Optional[str]:
         """
@@ -78,12 +152,32 @@ class BaseProcessor:
         Examples:
             "7:00 PM" -> "19:00"
             "10:30 AM" -> "10:30"
+        
+        Returns:
+            "HH:MM", or None if the string is not a 12-hour time
         """
-        try:
-            time_obj = datetime.strptime(time_str, '%I:%M %p')
-            return time_obj.strftime('%H:%M')
-        except:
+        converted = self._lookup_time(time_str)
+        if converted is None:
+            self.parse_failures['time'] += 1
+        return converted
+    
+    def _lookup_time(self, time_str: str) -> Optional[str]:
+        """Table lookup for convert_time_to_24h (does not count failures)"""
+        if time_str not in self._time_table:
+            self._time_table[time_str] = self._parse_time(time_str)
+        return self._time_table[time_str]
+    
+    @staticmethod
+    def _parse_time(time_str: str) -> Optional[str]:
+        """Parse "h:mm AM/PM" (also "7:00PM", "7:00 p.m.") without strptime"""
+        match = TIME_PATTERN.match(time_str) if time_str else None
+        if not match:
+            return None
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if not 1 <= hour <= 12 or minute > 59:
             return None
+        hour = hour % 12 + (12 if match.group(3) in 'Pp' else 0)
+        return f"{hour:02d}:{minute:02d}"
     
     def get_cinema_id(self, venue_name: str) -> str:
         """
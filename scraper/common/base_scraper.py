@@ -2,15 +2,16 @@
 Base Scraper - Shared scraping functionality for all cinema scrapers
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
 import sys
 import os
 
+# selenium and bs4 are imported on first use so offline modes start fast
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import main_config
@@ -33,6 +34,9 @@ class BaseScraper:
         
     def setup_selenium(self):
         """Initialize Selenium WebDriver"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         if main_config.USE_HEADLESS:
             chrome_options.add_argument('--headless')
@@ -61,8 +65,10 @@ class BaseScraper:
         time.sleep(wait)
         return self.driver.page_source
     
-    def parse_html(self, html_content: str) -> BeautifulSoup:
+    def parse_html(self, html_content: str) -> 'BeautifulSoup':
         """Parse HTML content with BeautifulSoup"""
+        from bs4 import BeautifulSoup
+        
         return BeautifulSoup(html_content, 'html.parser')
     
     def calculate_date(self, day_index: int) -> str:
@@ -0,0 +1,189 @@
+"""
+Checkpoint Store - Persist per-day scrape results and per-title enrichment as they complete
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.records import RawEntry
+
+
+class CheckpointStore:
+    """
+    On-disk checkpoints for one cinema
+
+    Layout (under CHECKPOINT_DIR/<cinema>/):
+        run.json          - id of the run the checkpoints belong to
+        days/<date>.json  - raw entries scraped for one show date
+        enrichment.jsonl  - one line per finished OMDb lookup
+
+    A unit of work counts as finished only if it was written by the current
+    run, so --resume picks up where an interrupted run stopped while a fresh
+    run always starts over.
+    """
+
+    def __init__(self, cinema: str, resume: bool = False, base_dir: str = None):
+        """
+        Initialize checkpoint store
+
+        Args:
+            cinema: Cinema name (e.g., "siff")
+            resume: Continue the previous run instead of starting a new one
+            base_dir: Checkpoint root (uses config default if None)
+        """
+        if base_dir is None:
+            base_dir = os.path.join(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                main_config.CHECKPOINT_DIR
+            )
+        self.cinema = cinema
+        self.directory = os.path.join(base_dir, cinema)
+        self.days_dir = os.path.join(self.directory, 'days')
+        self.run_file = os.path.join(self.directory, 'run.json')
+        self.enrichment_file = os.path.join(self.directory, 'enrichment.jsonl')
+        # Enrichment workers append concurrently
+        self._enrichment_lock = threading.Lock()
+        os.makedirs(self.days_dir, exist_ok=True)
+
+        previous_run = self._read_json(self.run_file)
+        if resume and previous_run:
+            self.run_id = previous_run['run_id']
+            self.resumed = True
+        else:
+            self.run_id = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+            self.resumed = False
+            self._write_json(self.run_file, {
+                "run_id": self.run_id,
+                "started_at": datetime.now().isoformat()
+            })
+            # Enrichment results only make sense within one run
+            open(self.enrichment_file, 'w').close()
+            self.prune_days(datetime.now().strftime('%Y-%m-%d'))
+
+    # ------------------------------------------------------------
+    # Raw per-day results
+    # ------------------------------------------------------------
+    def day_path(self, show_date: str) -> str:
+        """Checkpoint file for one show date"""
+        return os.path.join(self.days_dir, f"{show_date}.json")
+
+    def load_day(self, show_date: str) -> Optional[List[RawEntry]]:
+        """
+        Get raw entries for a show date if this run already scraped it
+
+        Returns:
+            List of raw entries, or None if the day still needs scraping
+        """
+        snapshot = self._read_json(self.day_path(show_date))
+        if not snapshot or snapshot.get('run_id') != self.run_id:
+            return None
+        return [RawEntry.from_dict(entry) for entry in snapshot['entries']]
+
+    def load_snapshot(self, show_date: str) -> Optional[List[RawEntry]]:
+        """
+        Get the most recently saved raw entries for a show date from any run
+
+        Used by adaptive scheduling to serve days that were not re-fetched.
+        """
+        snapshot = self._read_json(self.day_path(show_date))
+        if not snapshot:
+            return None
+        return [RawEntry.from_dict(entry) for entry in snapshot['entries']]
+
+    def load_all_snapshots(self, from_date: str = None) -> List[RawEntry]:
+        """
+        Get raw entries of every saved day, in date order
+
+        Args:
+            from_date: Skip show dates before this date (YYYY-MM-DD)
+
+        Returns:
+            Concatenated raw entries, as scrape_all_days would return them
+        """
+        entries = []
+        for filename in sorted(os.listdir(self.days_dir)):
+            if not filename.endswith('.json'):
+                continue
+            show_date = filename[:-len('.json')]
+            if from_date and show_date < from_date:
+                continue
+            entries.extend(self.load_snapshot(show_date) or [])
+        return entries
+
+    def has_snapshot(self, show_date: str) -> bool:
+        """Whether raw entries for a show date were saved by any run"""
+        return os.path.exists(self.day_path(show_date))
+
+    def save_day(self, day_index: int, show_date: str, entries: List[RawEntry]):
+        """Persist raw entries for a finished day"""
+        self._write_json(self.day_path(show_date), {
+            "run_id": self.run_id,
+            "day_index": day_index,
+            "show_date": show_date,
+            "fetched_at": datetime.now().isoformat(),
+            "entries": [entry.to_dict() for entry in entries]
+        })
+
+    def prune_days(self, before_date: str):
+        """Delete day checkpoints for show dates before the given date"""
+        for filename in os.listdir(self.days_dir):
+            if filename.endswith('.json') and filename[:-len('.json')] < before_date:
+                os.remove(os.path.join(self.days_dir, filename))
+
+    # ------------------------------------------------------------
+    # Per-title enrichment results
+    # ------------------------------------------------------------
+    def load_enrichments(self) -> Dict[Tuple[str, Optional[int]], Optional[Dict[str, Any]]]:
+        """
+        Get enrichment results finished by this run
+
+        Returns:
+            Mapping of (title, year) to enrichment dict (None = not found on OMDb)
+        """
+        enrichments = {}
+        if not os.path.exists(self.enrichment_file):
+            return enrichments
+        with open(self.enrichment_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Last line may be truncated if the process was killed mid-write
+                    continue
+                enrichments[(record['title'], record['year'])] = record['enrichment']
+        return enrichments
+
+    def save_enrichment(self, title: str, year: Optional[int], enrichment: Optional[Dict[str, Any]]):
+        """Append one finished lookup (safe to call from several threads)"""
+        record = {"title": title, "year": year, "enrichment": enrichment}
+        with self._enrichment_lock, open(self.enrichment_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    @staticmethod
+    def _read_json(path: str) -> Optional[Any]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: str, data: Any):
+        """Write atomically so a crash never leaves a half-written checkpoint"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
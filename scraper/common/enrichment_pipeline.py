@@ -0,0 +1,123 @@
+"""
+Enrichment Pipeline - Look up OMDb data while the scraper is still fetching pages
+
+The scraper is the producer: each finished day is handed to the processor,
+which queues the (title, year) keys it has not seen yet. Worker threads
+consume the queue and call OMDb, so enrichment runs during the browser waits
+instead of after them. Once scraping is done the queue is drained and the
+usual grouping/enrichment step reads the results instead of calling OMDb.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+
+# Queue entries sort by (priority, sequence); stop markers go after all work
+_STOP = 99
+
+
+class EnrichmentPipeline:
+    """
+    Worker threads running lookup(key) for keys submitted while scraping
+
+    Usage:
+        with EnrichmentPipeline(lookup) as pipeline:
+            ...                        # pipeline.submit(key) as days arrive
+        pipeline.results               # key -> lookup(key), all keys done
+    """
+
+    def __init__(self, lookup: Callable[[Hashable], Any], workers: int = None):
+        """
+        Initialize pipeline (workers start on `with`)
+
+        Args:
+            lookup: Called once per submitted key, from a worker thread
+            workers: Number of worker threads
+        """
+        self.lookup = lookup
+        self.workers = workers or main_config.ENRICHMENT_WORKERS
+        self.results: Dict[Hashable, Any] = {}
+        self.stats = Counter()
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._idle = [0.0] * self.workers
+        self._depths: List[int] = []
+        self._started = None
+        self._closed = None
+        self._drained = None
+        self._cancelled = False
+
+    def __enter__(self) -> 'EnrichmentPipeline':
+        self._started = time.monotonic()
+        for worker in range(self.workers):
+            thread = threading.Thread(target=self._work, args=(worker,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # On error, queued keys are dropped; lookups in flight still finish
+        self.close(cancel=exc_type is not None)
+
+    def submit(self, key: Hashable, priority: int = 0):
+        """Queue one lookup (lower priority values are looked up first)"""
+        self._queue.put((priority, next(self._sequence), key))
+        self.stats['queued'] += 1
+        self._depths.append(self._queue.qsize())
+
+    def close(self, cancel: bool = False):
+        """Wait until every queued key is looked up (or dropped, if cancel)"""
+        self._closed = time.monotonic()
+        self._cancelled = cancel
+        pending = self._queue.qsize()
+        if pending and main_config.VERBOSE and not cancel:
+            print(f"  Waiting for {pending} queued OMDb lookups...")
+        for _ in self._threads:
+            self._queue.put((_STOP, next(self._sequence), None))
+        for thread in self._threads:
+            thread.join()
+        self._drained = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Queue depth and timing for metadata.json
+
+        scrape_seconds is how long the producer ran, drain_seconds how long
+        enrichment went on after it; worker_idle_seconds is time the workers
+        spent waiting for keys (summed over workers).
+        """
+        return {
+            "workers": self.workers,
+            "queued": self.stats['queued'],
+            "looked_up": len(self.results),
+            "skipped": self.stats['skipped'],
+            "max_queue_depth": max(self._depths, default=0),
+            "avg_queue_depth": round(sum(self._depths) / len(self._depths), 1) if self._depths else 0,
+            "scrape_seconds": round(self._closed - self._started, 2) if self._closed else 0,
+            "drain_seconds": round(self._drained - self._closed, 2) if self._drained else 0,
+            "worker_idle_seconds": round(sum(self._idle), 2)
+        }
+
+    def _work(self, worker: int):
+        while True:
+            waiting = time.monotonic()
+            priority, _, key = self._queue.get()
+            self._idle[worker] += time.monotonic() - waiting
+            if priority == _STOP:
+                return
+            if self._cancelled:
+                continue
+            try:
+                self.results[key] = self.lookup(key)
+            except Exception as e:
+                # Left out of results; the enrichment step looks the key up again
+                print(f"    Enrichment failed for {key}: {e}")
@@ -0,0 +1,301 @@
+"""
+Film Identity - Recognize the same film across cinemas and listings
+
+Titles are normalized ("Room, The" -> "the room", accents and year suffixes
+removed), then a blocking index on title tokens and character trigrams finds
+a handful of candidate films for each new title, so titles are never compared
+all-pairs. Candidates are confirmed with year, director and duration.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.records import MovieRecord
+
+TRAILING_ARTICLE_PATTERN = re.compile(r'^(.*),\s*(the|a|an|la|le|les|el|los|das|der|die)$')
+YEAR_SUFFIX_PATTERN = re.compile(r'\s*[\(\[]\s*(19|20)\d{2}\s*[\)\]]\s*$|\s+-\s+(19|20)\d{2}\s*$')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Tokens too common to narrow down candidates
+STOP_TOKENS = {"the", "a", "an", "of", "and", "in", "on", "to", "la", "le", "el", "de"}
+
+QUOTE_TRANSLATION = str.maketrans({
+    '‘': "'", '’': "'", '“': '"', '”': '"', '–': '-', '—': '-'
+})
+
+
+@lru_cache(maxsize=8192)
+def normalize_title(title: str) -> str:
+    """
+    Canonical form used for matching
+
+    Examples:
+        "Room, The"            -> "the room"
+        "Amélie (2001)"        -> "amelie"
+        "If I Had Legs I’d..." -> "if i had legs id"
+    """
+    if not title:
+        return ""
+    text = unicodedata.normalize('NFKD', title.translate(QUOTE_TRANSLATION))
+    text = ''.join(c for c in text if not unicodedata.combining(c)).casefold().strip()
+    text = YEAR_SUFFIX_PATTERN.sub('', text)
+    match = TRAILING_ARTICLE_PATTERN.match(text)
+    if match:
+        text = f"{match.group(2)} {match.group(1)}"
+    text = NON_WORD_PATTERN.sub(lambda m: '' if m.group() == "'" else ' ', text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def title_variants(title: str) -> Set[str]:
+    """
+    Normalized forms a title may be listed under
+
+    Series/event prefixes and subtitles are split off, so
+    "SIFF Movie Club: The Ascent" also matches "The Ascent".
+    """
+    variants = {normalize_title(title)}
+    if title and ':' in title:
+        head, _, tail = title.partition(':')
+        variants.add(normalize_title(head))
+        variants.add(normalize_title(tail))
+    return {v for v in variants if v}
+
+
+def title_tokens(normalized: str) -> Set[str]:
+    """Tokens used for blocking"""
+    return {t for t in normalized.split() if t not in STOP_TOKENS}
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Character trigrams, used for blocking when tokens are misspelled"""
+    padded = f"  {normalized.replace(' ', '')} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleFacts(NamedTuple):
+    """A record's normalized title and the facts used to confirm a match"""
+    title: str
+    variants: Set[str]
+    year: Optional[int]
+    director: Optional[str]
+    duration: Optional[int]
+
+    @classmethod
+    def of(cls, record: MovieRecord) -> 'TitleFacts':
+        return cls.from_fields(record.title, record.year, record.director, record.duration)
+
+    @classmethod
+    def from_fields(
+        cls,
+        title: str,
+        year: Optional[int] = None,
+        director: Optional[str] = None,
+        duration: Optional[int] = None
+    ) -> 'TitleFacts':
+        return cls(
+            normalize_title(title),
+            title_variants(title),
+            year,
+            normalize_title(director) if director else None,
+            duration
+        )
+
+
+class Film:
+    """One resolved film and the facts known about it"""
+
+    __slots__ = ('film_id', 'titles', 'variants', 'year', 'director', 'duration', 'members')
+
+    def __init__(self, film_id: str):
+        self.film_id = film_id
+        self.titles = set()    # Full normalized titles of member records
+        self.variants = set()  # Titles plus their prefix/subtitle parts
+        self.year = None
+        self.director = None   # Normalized
+        self.duration = None
+        self.members = 0
+
+    def absorb(self, facts: TitleFacts):
+        """Add a record's facts to the film"""
+        self.titles.add(facts.title)
+        self.variants |= facts.variants
+        self.year = self.year or facts.year
+        self.director = self.director or facts.director
+        self.duration = self.duration or facts.duration
+        self.members += 1
+
+
+class FilmResolver:
+    """
+    Assigns a shared film_id to records that describe the same film
+
+    One resolver is used for all cinemas of a run, so the ids (and the
+    per-film OMDb/poster work keyed on them) are shared across cinemas.
+    """
+
+    def __init__(self, min_similarity: float = None):
+        """
+        Initialize resolver
+
+        Args:
+            min_similarity: Title similarity needed when no exact variant matches
+        """
+        self.min_similarity = min_similarity or main_config.FILM_MATCH_MIN_SIMILARITY
+        self.films: Dict[str, Film] = {}
+        self._title_index: Dict[str, Set[str]] = defaultdict(set)
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self.comparisons = 0
+        # Per-film results shared between cinemas (filled by processors)
+        self.enrichments: Dict[str, Optional[dict]] = {}
+
+    # ------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------
+    def assign(self, records: Iterable[MovieRecord]):
+        """Set film_id on each record, creating films as needed"""
+        for record in records:
+            record.film_id = self.resolve(TitleFacts.of(record)).film_id
+
+    def resolve(self, facts: TitleFacts) -> Film:
+        """Film for a record's facts (created if none matches); the facts join it"""
+        film = self.match(facts)
+        if film is None:
+            film = self._create(facts)
+        film.absorb(facts)
+        self._index(film, facts)
+        return film
+
+    def match(self, facts: TitleFacts) -> Optional[Film]:
+        """
+        Best existing film for a record's facts, or None
+
+        Films already listed under the exact same title are tried first; the
+        blocking index is only consulted for titles seen for the first time
+        (or whose namesakes contradict the record).
+        """
+        exact = self._title_index.get(facts.title, set())
+        best = self._best([self.films[film_id] for film_id in exact], facts)
+        if best is None:
+            best = self._best(
+                [film for film in self.candidates(facts.variants) if film.film_id not in exact], facts
+            )
+        return best
+
+    def candidates(self, variants: Set[str]) -> List[Film]:
+        """Films sharing a title token (or, failing that, enough trigrams)"""
+        film_ids = set()
+        for variant in variants:
+            for token in title_tokens(variant):
+                film_ids |= self._token_index.get(token, set())
+
+        if not film_ids:
+            for variant in variants:
+                grams = trigrams(variant)
+                counts = defaultdict(int)
+                for gram in grams:
+                    for film_id in self._trigram_index.get(gram, ()):
+                        counts[film_id] += 1
+                film_ids |= {film_id for film_id, n in counts.items() if n >= len(grams) // 2}
+
+        return [self.films[film_id] for film_id in film_ids]
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "films": len(self.films),
+            "records": sum(film.members for film in self.films.values()),
+            "comparisons": self.comparisons
+        }
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    def _best(self, films: List[Film], facts: TitleFacts) -> Optional[Film]:
+        best, best_score = None, 0.0
+        for film in films:
+            self.comparisons += 1
+            score = self._score(film, facts)
+            if score > best_score:
+                best, best_score = film, score
+        return best
+
+    def _score(self, film: Film, facts: TitleFacts) -> float:
+        """
+        0 if the record contradicts the film, otherwise a match strength
+
+        Contradictions: release years more than a year apart, different
+        directors, or running times more than 10 minutes apart.
+        """
+        if film.year and facts.year and abs(film.year - facts.year) > 1:
+            return 0.0
+        if film.director and facts.director and film.director != facts.director:
+            return 0.0
+        if film.duration and facts.duration and abs(film.duration - facts.duration) > 10:
+            return 0.0
+
+        if facts.title in film.titles:
+            similarity = 1.0
+        elif facts.title in film.variants or film.titles & facts.variants:
+            # One title is the other plus a series prefix or subtitle
+            similarity = 0.95
+        else:
+            similarity = max(SequenceMatcher(None, facts.title, title).ratio() for title in film.titles)
+
+        corroboration = sum((
+            bool(film.year and facts.year),
+            bool(film.director and facts.director),
+            bool(film.duration and facts.duration)
+        ))
+
+        if similarity >= 1.0:
+            return similarity + corroboration
+        if similarity >= self.min_similarity and corroboration >= 2:
+            return similarity + corroboration
+        return 0.0
+
+    def _create(self, facts: TitleFacts) -> Film:
+        seed = f"{facts.title}|{facts.year or ''}"
+        film_id = f"film_{hashlib.sha1(seed.encode('utf-8')).hexdigest()[:10]}"
+        while film_id in self.films:
+            film_id = f"film_{hashlib.sha1((seed + film_id).encode('utf-8')).hexdigest()[:10]}"
+        film = Film(film_id)
+        self.films[film_id] = film
+        return film
+
+    def _index(self, film: Film, facts: TitleFacts):
+        self._title_index[facts.title].add(film.film_id)
+        for variant in facts.variants:
+            for token in title_tokens(variant):
+                self._token_index[token].add(film.film_id)
+            for gram in trigrams(variant):
+                self._trigram_index[gram].add(film.film_id)
+
+
+def group_by_film(records: Iterable[MovieRecord]) -> List[Dict[str, Any]]:
+    """
+    Combined view: one entry per film with its screenings at each cinema
+
+    Returns:
+        [{"film_id", "movie": {...}, "screenings": [{"cinema_id", "showtimes"}]}]
+    """
+    films: Dict[Any, Dict[str, Any]] = {}
+    for record in records:
+        data = record.to_dict()
+        film_id = record.identity
+        if film_id not in films:
+            films[film_id] = {"film_id": record.film_id, "movie": data["movie"], "screenings": []}
+        films[film_id]["screenings"].append({
+            "cinema_id": data["cinema_id"],
+            "showtimes": data["showtimes"]
+        })
+    return list(films.values())
@@ -2,23 +2,147 @@
 OMDb API Client - Fetches additional movie information
 """
 
-import requests
-import time
 from typing import Dict, Any, Optional
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import main_config
+from common.omdb_scheduler import OMDbScheduler, OMDbError, TransientOMDbError, QuotaExceededError
+from common.title_index import TitleIndex
 
 
 class OMDbClient:
     """Client for interacting with OMDb API"""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[OMDbScheduler] = None, title_index: Optional[TitleIndex] = None):
         self.api_key = main_config.OMDB_API_KEY
         self.api_url = main_config.OMDB_API_URL
+        self.timeout = main_config.OMDB_TIMEOUT
+        self.scheduler = scheduler or OMDbScheduler()
+        self.title_index = title_index
         self.cache = {}  # Simple cache to avoid duplicate API calls
+        self.resolved = {}  # "title_year" -> enrichment answered by get_enrichment
+    
+    def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Make a single OMDb request and classify failures
+        
+        Args:
+            params: Query parameters (API key is added here)
+            
+        Returns:
+            Parsed JSON response
+            
+        Raises:
+            QuotaExceededError: Request limit reached or key rejected
+            TransientOMDbError: Timeout, connection error or 5xx
+            OMDbError: Any other non-retryable failure
+        """
+        # Imported here so runs that never call OMDb don't pay for it
+        import requests
+        
+        try:
+            response = requests.get(
+                self.api_url,
+                params={'apikey': self.api_key, **params},
+                timeout=self.timeout
+            )
+        except requests.exceptions.Timeout:
+            raise TransientOMDbError("timeout")
+        except requests.exceptions.ConnectionError as e:
+            raise TransientOMDbError(f"connection error: {e}")
+        except requests.exceptions.RequestException as e:
+            raise OMDbError(str(e))
+        
+        if response.status_code >= 500:
+            raise TransientOMDbError(f"HTTP {response.status_code}")
+        
+        try:
+            data = response.json()
+        except ValueError:
+            raise OMDbError(f"invalid JSON (HTTP {response.status_code})")
+        
+        error = str(data.get('Error', ''))
+        if 'limit' in error.lower() or 'invalid api key' in error.lower():
+            raise QuotaExceededError(error)
+        if response.status_code >= 400:
+            raise OMDbError(f"HTTP {response.status_code} - {error or 'Unknown error'}")
+        
+        return data
+    
+    def is_cached(self, title: str, year: Optional[int] = None) -> bool:
+        """Whether OMDb has answered this title/year lookup (found or not found)"""
+        key = f"{title}_{year}"
+        return key in self.cache or key in self.resolved
+    
+    def get_enrichment(self, title: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Enrichment for a scraped title, using the title index when available
+        
+        Order:
+            1. Title indexed and its enrichment fresh -> no request
+            2. Title indexed -> lookup by IMDb ID
+            3. Otherwise lookup by title and year; if OMDb has no film for that
+               year, one retry without the year, accepted only if OMDb's year
+               is within TITLE_YEAR_TOLERANCE (scraped years are sometimes off)
+        Titles resolved by 3. are added to the index.
+        
+        Args:
+            title: Movie title as scraped
+            year: Release year as scraped
+            
+        Returns:
+            Enrichment fields (see extract_enrichment_data) or None
+        """
+        cache_key = f"{title}_{year}"
+        if cache_key in self.resolved:
+            return self.resolved[cache_key]
+        index = self.title_index
+        
+        imdb_id = index.lookup(title, year) if index else None
+        if imdb_id:
+            enrichment = index.fresh_enrichment(imdb_id)
+            if enrichment is not None:
+                self.resolved[cache_key] = enrichment
+                return enrichment
+            
+            data = self.search_by_imdb_id(imdb_id)
+            if data:
+                enrichment = self.extract_enrichment_data(data)
+                index.store_enrichment(imdb_id, enrichment)
+                self.resolved[cache_key] = enrichment
+                return enrichment
+            if imdb_id not in self.cache:
+                return None  # Skipped or failed; retry next run
+            # Stale mapping (OMDb no longer knows the ID) - fall back to the title
+        
+        data = self.search_by_title_year(title, year)
+        if data is None and year and self.is_cached(title, year):
+            data = self.search_by_title_year(title)
+            omdb_year = self._year_of(data)
+            if data and (omdb_year is None or abs(omdb_year - year) > main_config.TITLE_YEAR_TOLERANCE):
+                data = None
+            self.cache[cache_key] = data
+        
+        if not data:
+            return None
+        
+        enrichment = self.extract_enrichment_data(data)
+        self.resolved[cache_key] = enrichment
+        if index and data.get('imdbID'):
+            omdb_year = self._year_of(data)
+            index.record(title, omdb_year, data['imdbID'])
+            if data.get('Title'):
+                index.record(data['Title'], omdb_year, data['imdbID'])
+            index.store_enrichment(data['imdbID'], enrichment)
+        return enrichment
+    
+    @staticmethod
+    def _year_of(data: Optional[Dict[str, Any]]) -> Optional[int]:
+        """Release year of an OMDb response ("2003", "2019–2021")"""
+        year = str((data or {}).get('Year', ''))[:4]
+        return int(year) if year.isdigit() else None
     
     def search_by_title_year(self, title: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
@@ -36,40 +160,29 @@ class OMDbClient:
         if cache_key in self.cache:
             return self.cache[cache_key]
         
-        try:
-            params = {
-                'apikey': self.api_key,
-                't': title,
-                'plot': 'short',  # or 'full' for longer plot
-                'r': 'json'
-            }
-            
-            if year:
-                params['y'] = year
-            
-            response = requests.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Check if movie was found
-            if data.get('Response') == 'True':
-                # Cache the result
-                self.cache[cache_key] = data
-                return data
-            else:
-                print(f"    OMDb: '{title}' ({year}) not found - {data.get('Error', 'Unknown error')}")
-                self.cache[cache_key] = None
-                return None
-                
-        except requests.exceptions.Timeout:
-            print(f"    OMDb: Timeout for '{title}'")
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"    OMDb: Error fetching '{title}': {e}")
+        params = {
+            't': title,
+            'plot': 'short',  # or 'full' for longer plot
+            'r': 'json'
+        }
+        
+        if year:
+            params['y'] = year
+        
+        data = self.scheduler.call(lambda: self._get(params), description=f"'{title}'")
+        
+        # Skipped or failed calls are not cached so a later run can retry them
+        if data is None:
             return None
-        except Exception as e:
-            print(f"    OMDb: Unexpected error for '{title}': {e}")
+        
+        # Check if movie was found
+        if data.get('Response') == 'True':
+            # Cache the result
+            self.cache[cache_key] = data
+            return data
+        else:
+            print(f"    OMDb: '{title}' ({year}) not found - {data.get('Error', 'Unknown error')}")
+            self.cache[cache_key] = None
             return None
     
     def search_by_imdb_id(self, imdb_id: str) -> Optional[Dict[str, Any]]:
@@ -86,28 +199,22 @@ class OMDbClient:
         if imdb_id in self.cache:
             return self.cache[imdb_id]
         
-        try:
-            params = {
-                'apikey': self.api_key,
-                'i': imdb_id,
-                'plot': 'short',
-                'r': 'json'
-            }
-            
-            response = requests.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('Response') == 'True':
-                self.cache[imdb_id] = data
-                return data
-            else:
-                self.cache[imdb_id] = None
-                return None
-                
-        except Exception as e:
-            print(f"    OMDb: Error fetching IMDb ID '{imdb_id}': {e}")
+        params = {
+            'i': imdb_id,
+            'plot': 'short',
+            'r': 'json'
+        }
+        
+        data = self.scheduler.call(lambda: self._get(params), description=f"IMDb ID '{imdb_id}'")
+        
+        if data is None:
+            return None
+        
+        if data.get('Response') == 'True':
+            self.cache[imdb_id] = data
+            return data
+        else:
+            self.cache[imdb_id] = None
             return None
     
     def extract_enrichment_data(self, omdb_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,217 @@
+"""
+OMDb Request Scheduler - Quota tracking, retries and circuit breaking for OMDb calls
+"""
+
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+
+
+class OMDbError(Exception):
+    """Non-retryable OMDb failure (bad request, unexpected response)"""
+
+
+class TransientOMDbError(OMDbError):
+    """Timeout, connection error or 5xx response - worth retrying"""
+
+
+class QuotaExceededError(OMDbError):
+    """OMDb refused the request because the key is exhausted or invalid"""
+
+
+class OMDbScheduler:
+    """
+    Gatekeeper for every OMDb HTTP request made during a run
+
+    Tracks calls against the daily budget, retries transient failures with
+    jittered exponential backoff and opens a circuit breaker once OMDb reports
+    quota exhaustion or keeps failing, so the rest of the run skips OMDb.
+
+    Safe to share between enrichment worker threads: the budget check, pacing,
+    call and failure accounting and the breaker are serialized; the requests
+    themselves are not.
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = None,
+        calls_used_today: int = 0,
+        max_retries: int = None,
+        backoff_base: float = None,
+        backoff_max: float = None,
+        failure_threshold: int = None,
+        request_delay: float = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            daily_budget: Maximum OMDb calls per day (uses config default if None)
+            calls_used_today: Calls already spent today by earlier runs
+            max_retries: Retries per lookup after the first attempt
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound for a single backoff delay
+            failure_threshold: Consecutive transient failures that open the breaker
+            request_delay: Polite delay between successive calls
+            sleep: Sleep function (injectable for tests/benchmarks)
+        """
+        self.daily_budget = daily_budget if daily_budget is not None else main_config.OMDB_DAILY_BUDGET
+        self.max_retries = max_retries if max_retries is not None else main_config.OMDB_MAX_RETRIES
+        self.backoff_base = backoff_base if backoff_base is not None else main_config.OMDB_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else main_config.OMDB_BACKOFF_MAX
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None else main_config.OMDB_BREAKER_THRESHOLD
+        )
+        self.request_delay = request_delay if request_delay is not None else main_config.OMDB_REQUEST_DELAY
+        self.sleep = sleep
+
+        self.date = datetime.now().strftime('%Y-%m-%d')
+        self.calls_used = calls_used_today
+        self.calls_this_run = 0
+        self.calls_skipped = 0
+        self.retries = 0
+        self.consecutive_failures = 0
+        self.circuit_open = False
+        self.circuit_reason = None
+        self._last_call = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_metadata(cls, metadata: Optional[Dict[str, Any]], **kwargs) -> 'OMDbScheduler':
+        """
+        Create a scheduler seeded with today's usage from a previous metadata.json
+
+        Args:
+            metadata: Parsed metadata.json (or None if unavailable)
+
+        Returns:
+            Scheduler that continues today's call count
+        """
+        scheduler = cls(**kwargs)
+        previous = (metadata or {}).get('omdb') or {}
+        if previous.get('date') == scheduler.date:
+            scheduler.calls_used = previous.get('calls_used', 0)
+        return scheduler
+
+    @property
+    def remaining(self) -> int:
+        """Calls left in today's budget"""
+        return max(self.daily_budget - self.calls_used, 0)
+
+    def can_call(self) -> bool:
+        """Whether another request may be sent right now"""
+        return not self.circuit_open and self.remaining > 0
+
+    def open_circuit(self, reason: str):
+        """Stop all further OMDb calls for the rest of the run"""
+        with self._lock:
+            if not self.circuit_open:
+                print(f"    OMDb: Circuit breaker opened - {reason}")
+            self.circuit_open = True
+            self.circuit_reason = reason
+
+    def prioritize(self, keys: Iterable[Hashable], is_cached: Callable[[Hashable], bool]) -> List[Hashable]:
+        """
+        Order lookups so titles without cached data go before refreshes
+
+        Args:
+            keys: Lookup keys in discovery order
+            is_cached: Returns True if usable data for the key already exists
+
+        Returns:
+            Keys with uncached ones first (stable within each group)
+        """
+        keys = list(keys)
+        return [k for k in keys if not is_cached(k)] + [k for k in keys if is_cached(k)]
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (1-based)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def call(self, request: Callable[[], Any], description: str = '') -> Any:
+        """
+        Execute one OMDb request under budget, retry and breaker rules
+
+        Args:
+            request: Zero-argument callable performing a single HTTP attempt.
+                     Raises TransientOMDbError / QuotaExceededError / OMDbError.
+            description: Label used in log messages
+
+        Returns:
+            Result of request(), or None if the call was skipped or failed
+        """
+        attempt = 0
+        while True:
+            with self._lock:
+                if not self.can_call():
+                    if attempt:
+                        return None
+                    self.calls_skipped += 1
+                    if self.remaining == 0 and not self.circuit_open:
+                        self.open_circuit(f"daily budget of {self.daily_budget} calls used")
+                    return None
+                self._pace()
+                self.calls_used += 1
+                self.calls_this_run += 1
+
+            try:
+                result = request()
+            except QuotaExceededError as e:
+                self.open_circuit(str(e))
+                return None
+            except TransientOMDbError as e:
+                with self._lock:
+                    self.consecutive_failures += 1
+                    if self.consecutive_failures >= self.failure_threshold:
+                        self.open_circuit(f"{self.consecutive_failures} consecutive failures ({e})")
+                        return None
+                    give_up = attempt >= self.max_retries or not self.can_call()
+                    if not give_up:
+                        self.retries += 1
+                if give_up:
+                    print(f"    OMDb: Giving up on {description or 'request'}: {e}")
+                    return None
+                attempt += 1
+                delay = self.backoff_delay(attempt)
+                if main_config.VERBOSE:
+                    print(f"    OMDb: {e} - retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                self.sleep(delay)
+            except OMDbError as e:
+                with self._lock:
+                    self.consecutive_failures = 0
+                print(f"    OMDb: Error for {description or 'request'}: {e}")
+                return None
+            else:
+                with self._lock:
+                    self.consecutive_failures = 0
+                return result
+
+    def _pace(self):
+        """Keep at least request_delay seconds between successive calls"""
+        if self._last_call is not None and self.request_delay > 0:
+            elapsed = time.monotonic() - self._last_call
+            if elapsed < self.request_delay:
+                self.sleep(self.request_delay - elapsed)
+        self._last_call = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Usage summary for metadata.json"""
+        return {
+            "date": self.date,
+            "daily_budget": self.daily_budget,
+            "calls_used": self.calls_used,
+            "calls_this_run": self.calls_this_run,
+            "calls_skipped": self.calls_skipped,
+            "retries": self.retries,
+            "circuit_open": self.circuit_open,
+            "circuit_reason": self.circuit_reason
+        }
@@ -0,0 +1,325 @@
+"""
+Poster Pipeline - Download posters once, store them by content hash and build thumbnails
+
+Stage layout:
+    1. Collect distinct poster URLs (SIFF image_url and OMDb poster_omdb),
+       one per film when records carry a film_id
+    2. Download them concurrently with a bounded thread pool, using ETag /
+       Last-Modified so unchanged posters are not downloaded again
+    3. Store originals content-addressed (sha256), so a poster shared by several
+       movies or cinemas is stored once
+    4. Build small thumbnails for new hashes in a process pool (Pillow)
+    5. Point each movie at its local thumbnails
+
+The manifest (url -> hash/ETag, hash -> thumbnail) is saved next to the output
+files so later runs - including fresh CI runners - can skip unchanged posters.
+"""
+
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.records import MovieRecord
+
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Movie field holding the source URL -> field that receives the thumbnail path
+POSTER_FIELDS = {
+    "image_url": "image_thumbnail",
+    "poster_omdb": "poster_thumbnail"
+}
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif"
+}
+
+
+def make_thumbnail(source_path: str, dest_path: str, width: int, image_format: str) -> Optional[str]:
+    """
+    Resize one image (runs in a worker process)
+
+    Returns:
+        dest_path on success, None if the image could not be decoded
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(source_path) as image:
+            image = image.convert("RGB")
+            if image.width > width:
+                height = round(image.height * width / image.width)
+                image = image.resize((width, height), Image.LANCZOS)
+            tmp_path = f"{dest_path}.tmp"
+            image.save(tmp_path, format=image_format.upper(), quality=80)
+            os.replace(tmp_path, dest_path)
+        return dest_path
+    except (OSError, ValueError) as e:
+        print(f"    Posters: Could not thumbnail {os.path.basename(source_path)}: {e}")
+        return None
+
+
+class PosterPipeline:
+    """Fetch, dedupe and thumbnail movie posters"""
+
+    def __init__(
+        self,
+        output_dir: str,
+        thumbnail_dir: str = None,
+        cache_dir: str = None,
+        public_path: str = None,
+        download_workers: int = None,
+        thumbnail_workers: int = None,
+        session: Any = None
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            output_dir: Directory holding the output files (manifest goes here)
+            thumbnail_dir: Where thumbnails are written (served by the frontend)
+            cache_dir: Where content-addressed originals are stored
+            public_path: URL prefix under which thumbnail_dir is served
+            download_workers: Concurrent downloads
+            thumbnail_workers: Processes used for thumbnailing
+            session: requests-compatible session (created lazily if None)
+        """
+        self.manifest_path = os.path.join(output_dir, main_config.POSTER_MANIFEST_FILE)
+        self.thumbnail_dir = thumbnail_dir or os.path.join(SCRAPER_DIR, main_config.POSTER_THUMBNAIL_DIR)
+        self.cache_dir = cache_dir or os.path.join(SCRAPER_DIR, main_config.POSTER_CACHE_DIR)
+        self.public_path = (public_path if public_path is not None else main_config.POSTER_PUBLIC_PATH).rstrip('/')
+        self.download_workers = download_workers or main_config.POSTER_DOWNLOAD_WORKERS
+        self.thumbnail_workers = thumbnail_workers or main_config.POSTER_THUMBNAIL_WORKERS
+        self.width = main_config.POSTER_THUMBNAIL_WIDTH
+        self.image_format = main_config.POSTER_THUMBNAIL_FORMAT
+        self.session = session
+        self.stats = Counter()
+        # (film identity, source field) -> poster URL used for every record of that film
+        self.film_urls: Dict[Tuple[Any, str], str] = {}
+        self.fetched = set()  # URLs already fetched this run (by an earlier cinema)
+
+        self.manifest = {"urls": {}, "thumbnails": {}}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self.manifest.update(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"    Posters: Ignoring unreadable manifest: {e}")
+
+    # ------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------
+    def run(self, records: List[MovieRecord]):
+        """Download, store and thumbnail posters for the records, then link them"""
+        urls = self.poster_urls(records)
+        if main_config.VERBOSE:
+            print(f"  Posters: {len(urls)} distinct URLs")
+
+        self.fetch_all(urls)
+        self.build_thumbnails({
+            self.manifest["urls"][url]["hash"] for url in urls if url in self.manifest["urls"]
+        })
+        self.apply(records)
+
+        if main_config.VERBOSE:
+            print(f"  Posters: {self.stats['downloaded']} downloaded, {self.stats['unchanged']} unchanged, "
+                  f"{self.stats['deduplicated']} duplicates, {self.stats['thumbnails']} thumbnails built, "
+                  f"{self.stats['failed']} failed")
+
+    def apply(self, records: List[MovieRecord]):
+        """Attach local thumbnail paths known from the manifest (no network)"""
+        for record in records:
+            for source_field, thumbnail_field in POSTER_FIELDS.items():
+                url = self._field(record, source_field)
+                thumbnail = self.thumbnail_for(self.film_urls.get((record.identity, source_field), url))
+                thumbnail = thumbnail or self.thumbnail_for(url)
+                if thumbnail:
+                    record.images[thumbnail_field] = thumbnail
+                else:
+                    record.images.pop(thumbnail_field, None)
+
+    def thumbnail_for(self, url: Optional[str]) -> Optional[str]:
+        """Public path of the thumbnail for a poster URL, if one exists"""
+        entry = self.manifest["urls"].get(url) if url else None
+        filename = self.manifest["thumbnails"].get(entry["hash"]) if entry else None
+        if not filename or not os.path.exists(os.path.join(self.thumbnail_dir, filename)):
+            return None
+        return f"{self.public_path}/{filename}"
+
+    def save(self):
+        """Write the manifest"""
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    # ------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------
+    def poster_urls(self, records: Iterable[MovieRecord]) -> List[str]:
+        """
+        Distinct poster URLs, in first-seen order
+
+        Records of the same film (e.g. the same film listed by several cinemas
+        under different image URLs) share the first URL seen for it.
+        """
+        urls = {}
+        for record in records:
+            for source_field in POSTER_FIELDS:
+                url = self._field(record, source_field)
+                if not url or not url.startswith('http'):
+                    continue
+                url = self.film_urls.setdefault((record.identity, source_field), url)
+                urls[url] = None
+        return list(urls)
+
+    def fetch_all(self, urls: List[str]):
+        """Download posters with a bounded thread pool"""
+        urls = [url for url in urls if url not in self.fetched]
+        self.fetched.update(urls)
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            for url, status, info in pool.map(self._download, urls):
+                self.stats[status] += 1
+                if info:
+                    self.manifest["urls"][url] = info
+
+    def build_thumbnails(self, hashes: Iterable[str]):
+        """Create thumbnails for hashes that do not have one yet"""
+        jobs = []
+        for content_hash in sorted(hashes):
+            filename = f"{content_hash}_w{self.width}.{self.image_format}"
+            if os.path.exists(os.path.join(self.thumbnail_dir, filename)):
+                self.manifest["thumbnails"][content_hash] = filename
+                continue
+            source = self._find_original(content_hash)
+            if source:
+                jobs.append((content_hash, source, filename))
+
+        if not jobs:
+            return
+        if importlib.util.find_spec("PIL") is None:
+            print(f"    Posters: Pillow not installed - skipping {len(jobs)} thumbnails")
+            return
+
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+        # spawn: HTTP cinemas may be fetching on a background thread, and forking a threaded process is unsafe
+        with ProcessPoolExecutor(
+            max_workers=self.thumbnail_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            futures = {
+                pool.submit(
+                    make_thumbnail, source, os.path.join(self.thumbnail_dir, filename),
+                    self.width, self.image_format
+                ): (content_hash, filename)
+                for content_hash, source, filename in jobs
+            }
+            for future, (content_hash, filename) in futures.items():
+                if future.result():
+                    self.manifest["thumbnails"][content_hash] = filename
+                    self.stats['thumbnails'] += 1
+                else:
+                    self.stats['failed'] += 1
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    def _get_session(self):
+        if self.session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self.session = requests.Session()
+            self.session.headers['User-Agent'] = main_config.USER_AGENT
+            adapter = HTTPAdapter(pool_connections=self.download_workers, pool_maxsize=self.download_workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+        return self.session
+
+    def _download(self, url: str) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+        """
+        Fetch one poster (runs in a worker thread)
+
+        Returns:
+            (url, status, manifest entry) - status is one of "downloaded",
+            "unchanged", "deduplicated" or "failed"
+        """
+        previous = self.manifest["urls"].get(url)
+        headers = {}
+        # Conditional request only if we still have something built from the last download
+        if previous and (self._find_original(previous["hash"]) or previous["hash"] in self.manifest["thumbnails"]):
+            if previous.get("etag"):
+                headers['If-None-Match'] = previous["etag"]
+            if previous.get("last_modified"):
+                headers['If-Modified-Since'] = previous["last_modified"]
+
+        try:
+            response = self._get_session().get(url, headers=headers, timeout=main_config.POSTER_TIMEOUT)
+            if response.status_code == 304:
+                return url, "unchanged", dict(previous, checked_at=datetime.now().isoformat(timespec='seconds'))
+            response.raise_for_status()
+        except Exception as e:
+            print(f"    Posters: Error fetching {url}: {e}")
+            return url, "failed", previous
+
+        content = response.content
+        content_hash = hashlib.sha256(content).hexdigest()
+        extension = CONTENT_TYPE_EXTENSIONS.get(
+            response.headers.get('Content-Type', '').split(';')[0].strip(), '.img'
+        )
+        status = "deduplicated" if self._find_original(content_hash) else "downloaded"
+        if status == "downloaded":
+            self._store_original(content_hash, extension, content)
+        elif previous and previous["hash"] == content_hash:
+            status = "unchanged"
+
+        return url, status, {
+            "hash": content_hash,
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "checked_at": datetime.now().isoformat(timespec='seconds')
+        }
+
+    def _original_dir(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, content_hash[:2])
+
+    def _find_original(self, content_hash: str) -> Optional[str]:
+        directory = self._original_dir(content_hash)
+        if not os.path.isdir(directory):
+            return None
+        for filename in os.listdir(directory):
+            if filename.startswith(content_hash) and not filename.endswith('.tmp'):
+                return os.path.join(directory, filename)
+        return None
+
+    def _store_original(self, content_hash: str, extension: str, content: bytes):
+        directory = self._original_dir(content_hash)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{content_hash}{extension}")
+        # Unique tmp name: two threads may store the same content at once
+        tmp_path = f"{path}.{os.getpid()}.{id(content)}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _field(record: MovieRecord, field: str) -> Optional[str]:
+        if field == "image_url":
+            return record.image_url
+        return record.enrichment.get(field)
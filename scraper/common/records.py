@@ -0,0 +1,155 @@
+"""
+Record Types - Compact containers for raw entries, showtimes and processed movies
+
+Raw entries and showtimes are tuple-backed (NamedTuple), processed movies use
+__slots__. Repeated strings (titles, URLs, venues, dates, cinema IDs, times)
+are interned so every copy shares one object. Records are converted to plain
+dicts only when they are written to JSON.
+"""
+
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+def intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern that passes None through"""
+    return sys.intern(value) if value is not None else None
+
+
+class RawEntry(NamedTuple):
+    """One movie listing for one venue on one day, as scraped"""
+    title: str
+    url: Optional[str]
+    image_url: Optional[str]
+    metadata: str
+    venue: Optional[str]
+    showtimes: Tuple[str, ...]
+    show_date: str
+    day_index: int
+    date_text: str
+
+    @classmethod
+    def create(
+        cls,
+        title: str,
+        url: Optional[str],
+        image_url: Optional[str],
+        metadata: str,
+        venue: Optional[str],
+        showtimes: List[str],
+        show_date: str,
+        day_index: int,
+        date_text: str
+    ) -> 'RawEntry':
+        """Build an entry with all repeated strings interned"""
+        return cls(
+            intern(title),
+            intern(url),
+            intern(image_url),
+            intern(metadata),
+            intern(venue),
+            tuple(sys.intern(t) for t in showtimes),
+            intern(show_date),
+            day_index,
+            intern(date_text)
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RawEntry':
+        """Rebuild an entry from its JSON form"""
+        return cls.create(**{field: data.get(field) for field in cls._fields})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form (same keys as the original raw dicts)"""
+        data = self._asdict()
+        data['showtimes'] = list(self.showtimes)
+        return data
+
+
+class Showtime(NamedTuple):
+    """One screening; tuples sort by (show_date, show_time)"""
+    show_date: str
+    show_time: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"show_date": self.show_date, "show_time": self.show_time}
+
+
+class MovieRecord:
+    """A processed movie at one cinema, with its showtimes and OMDb enrichment"""
+
+    __slots__ = (
+        'title', 'url', 'image_url', 'country', 'year', 'duration', 'director',
+        'cinema_id', 'showtimes', 'scraped_at', 'enrichment', 'images', 'film_id'
+    )
+
+    def __init__(
+        self,
+        title: str,
+        url: Optional[str],
+        image_url: Optional[str],
+        country: Optional[str],
+        year: Optional[int],
+        duration: Optional[int],
+        director: Optional[str],
+        cinema_id: str,
+        showtimes: List[Showtime],
+        scraped_at: str,
+        enrichment: Optional[Dict[str, Any]] = None,
+        images: Optional[Dict[str, str]] = None,
+        film_id: Optional[str] = None
+    ):
+        self.title = title
+        self.url = url
+        self.image_url = image_url
+        self.country = country
+        self.year = year
+        self.duration = duration
+        self.director = director
+        self.cinema_id = intern(cinema_id)
+        self.showtimes = showtimes
+        self.scraped_at = intern(scraped_at)
+        self.enrichment = enrichment or {}
+        self.images = images or {}  # Local thumbnail paths (see PosterPipeline)
+        self.film_id = film_id  # Shared across cinemas (see FilmResolver)
+
+    @property
+    def key(self) -> Tuple[str, Optional[int]]:
+        """(title, year) - the OMDb lookup key"""
+        return (self.title, self.year)
+
+    @property
+    def identity(self) -> Any:
+        """film_id if resolved, otherwise the lookup key"""
+        return self.film_id or self.key
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form written to the output files"""
+        movie = {
+            "title": self.title,
+            "url": self.url,
+            "image_url": self.image_url,
+            "country": self.country,
+            "year": self.year,
+            "duration": self.duration,
+            "director": self.director
+        }
+        movie.update(self.enrichment)
+        movie.update(self.images)
+        data = {
+            "movie": movie,
+            "cinema_id": self.cinema_id,
+            "showtimes": [showtime.to_dict() for showtime in self.showtimes],
+            "scraped_at": self.scraped_at
+        }
+        if self.film_id:
+            data["film_id"] = self.film_id
+        return data
+
+    def __repr__(self) -> str:
+        return f"MovieRecord({self.title!r} @ {self.cinema_id}, {len(self.showtimes)} showtimes)"
+
+
+def to_dicts(records: List[Any]) -> List[Dict[str, Any]]:
+    """Convert records to dicts at the serialization boundary"""
+    return [record.to_dict() for record in records]
@@ -0,0 +1,198 @@
+"""
+Refresh Scheduler - Decide which days to re-fetch based on how often they change
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.records import RawEntry
+
+# Raw entry fields that describe page content (day_index/date_text shift from day to day)
+CONTENT_FIELDS = ("title", "url", "image_url", "metadata", "venue", "showtimes", "show_date")
+
+SCHEDULE_MODES = ("full", "adaptive", "watch")
+
+
+class RefreshScheduler:
+    """
+    Per-cinema refresh planner backed by day history stored in metadata.json
+
+    History is keyed by show date:
+        {
+            "2025-11-03": {
+                "hash": "...",                  # content hash of the last fetch
+                "last_fetched": "2025-11-01T06:14:37",
+                "last_changed": "2025-10-31T06:12:01",
+                "avg_fetch_seconds": 4.2,
+                "history": [["2025-10-31T06:12:01", true], ["2025-11-01T06:14:37", false]]
+            }
+        }
+
+    Modes:
+        full     - fetch every day (history is still recorded)
+        adaptive - always fetch near-term days; fetch other days once their
+                   interval has elapsed, within the per-run time budget
+        watch    - fetch near-term days only (used by --watch polling)
+    """
+
+    def __init__(
+        self,
+        history: Optional[Dict[str, Dict[str, Any]]] = None,
+        mode: str = "full",
+        always_days: int = None,
+        time_budget: float = None,
+        now: Optional[datetime] = None
+    ):
+        """
+        Initialize refresh scheduler
+
+        Args:
+            history: Day history from the previous metadata.json for this cinema
+            mode: One of SCHEDULE_MODES
+            always_days: Day indices below this are fetched every run
+            time_budget: Seconds available for optional refreshes (adaptive mode)
+            now: Reference time (defaults to current time)
+        """
+        if mode not in SCHEDULE_MODES:
+            raise ValueError(f"Unknown schedule mode: {mode}. Available: {list(SCHEDULE_MODES)}")
+        self.mode = mode
+        self.history = dict(history or {})
+        self.always_days = always_days if always_days is not None else main_config.REFRESH_ALWAYS_DAYS
+        self.time_budget = time_budget if time_budget is not None else main_config.REFRESH_TIME_BUDGET_SECONDS
+        self.now = now or datetime.now()
+        self.fetched = []
+        self.reused = []
+        self.changed = []
+
+    @staticmethod
+    def content_hash(entries: List[RawEntry]) -> str:
+        """Order-independent hash of the page content for one day"""
+        canonical = sorted(
+            json.dumps([getattr(entry, field) for field in CONTENT_FIELDS], ensure_ascii=False)
+            for entry in entries
+        )
+        return hashlib.sha256('\n'.join(canonical).encode('utf-8')).hexdigest()[:16]
+
+    def cinema_change_rate(self) -> float:
+        """Share of all recorded re-fetches (any day) that found changed content"""
+        outcomes = [changed for record in self.history.values() for _, changed in record.get('history', [])[1:]]
+        return sum(outcomes) / len(outcomes) if outcomes else 1.0
+
+    def refresh_interval(self, record: Dict[str, Any]) -> float:
+        """
+        Hours a day may go without a refresh
+
+        Doubles with every consecutive unchanged fetch (0 after a change), capped
+        at REFRESH_MAX_INTERVAL_HOURS and shortened by up to half for cinemas
+        whose listings change often.
+        """
+        streak = 0
+        for _, changed in reversed(record.get('history', [])):
+            if changed:
+                break
+            streak += 1
+        if streak == 0:
+            return 0.0
+        interval = min(
+            main_config.REFRESH_BASE_INTERVAL_HOURS * 2 ** (streak - 1),
+            main_config.REFRESH_MAX_INTERVAL_HOURS
+        )
+        return interval * (1 - 0.5 * self.cinema_change_rate())
+
+    def estimated_cost(self, record: Dict[str, Any]) -> float:
+        """Seconds a fetch of this day is expected to take"""
+        return record.get('avg_fetch_seconds') or (main_config.PAGE_LOAD_WAIT + main_config.REQUEST_DELAY)
+
+    def plan(
+        self,
+        days: List[int],
+        calculate_date: Callable[[int], str],
+        has_snapshot: Callable[[str], bool]
+    ) -> List[int]:
+        """
+        Choose which day indices to fetch this run
+
+        Args:
+            days: Candidate day indices (from days_to_scrape)
+            calculate_date: Maps a day index to its show date
+            has_snapshot: Whether saved raw entries exist for a show date
+
+        Returns:
+            Day indices to fetch; the rest can be served from snapshots
+        """
+        if self.mode == "full":
+            return list(days)
+
+        mandatory, optional = [], []
+        for day in days:
+            show_date = calculate_date(day)
+            record = self.history.get(show_date)
+            if day < self.always_days or not record or not has_snapshot(show_date):
+                mandatory.append(day)
+            elif self.mode == "adaptive":
+                last_fetched = datetime.fromisoformat(record['last_fetched'])
+                age_hours = (self.now - last_fetched).total_seconds() / 3600
+                if age_hours >= self.refresh_interval(record):
+                    optional.append(day)
+
+        selected = list(mandatory)
+        spent = sum(self.estimated_cost(self.history.get(calculate_date(d), {})) for d in mandatory)
+        for day in optional:
+            cost = self.estimated_cost(self.history[calculate_date(day)])
+            if spent + cost > self.time_budget:
+                break
+            selected.append(day)
+            spent += cost
+
+        return sorted(selected)
+
+    def record_fetch(self, show_date: str, entries: List[RawEntry], duration: float) -> bool:
+        """
+        Update history after a successful fetch
+
+        Returns:
+            True if the content differs from the previous fetch
+        """
+        timestamp = self.now.isoformat(timespec='seconds')
+        new_hash = self.content_hash(entries)
+        record = self.history.get(show_date, {})
+        changed = record.get('hash') != new_hash
+
+        previous_avg = record.get('avg_fetch_seconds')
+        history = record.get('history', []) + [[timestamp, changed]]
+
+        self.history[show_date] = {
+            "hash": new_hash,
+            "last_fetched": timestamp,
+            "last_changed": timestamp if changed else record.get('last_changed', timestamp),
+            "avg_fetch_seconds": round(duration if previous_avg is None else 0.7 * previous_avg + 0.3 * duration, 2),
+            "history": history[-main_config.REFRESH_HISTORY_LENGTH:]
+        }
+        self.fetched.append(show_date)
+        if changed:
+            self.changed.append(show_date)
+        return changed
+
+    def record_reuse(self, show_date: str):
+        """Note that a day was served from its snapshot"""
+        self.reused.append(show_date)
+
+    def get_history(self) -> Dict[str, Dict[str, Any]]:
+        """History to store in metadata.json (past show dates dropped)"""
+        today = self.now.strftime('%Y-%m-%d')
+        return {date: record for date, record in sorted(self.history.items()) if date >= today}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary of this run's scheduling decisions"""
+        return {
+            "mode": self.mode,
+            "fetched": len(self.fetched),
+            "reused": len(self.reused),
+            "changed": len(self.changed)
+        }
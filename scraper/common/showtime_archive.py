@@ -0,0 +1,215 @@
+"""
+Showtime Archive - Keep live outputs to upcoming showtimes and archive the past ones
+"""
+
+import gzip
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.records import MovieRecord
+
+# Fields of one archived showtime (one NDJSON line)
+ARCHIVE_FIELDS = ("show_date", "show_time", "cinema_id", "film_id", "title", "year", "url", "scraped_at")
+
+
+def archive_key(row: Dict[str, Any]) -> Tuple:
+    """
+    Identity of an archived showtime, used for deduplication
+
+    The cinema's own title is used rather than film_id, which older rows lack.
+    """
+    return (row["show_date"], row["show_time"], row.get("cinema_id") or "", row.get("title") or "")
+
+
+class ShowtimeArchive:
+    """
+    Rolling retention for output files
+
+    Showtimes before "now" in the cinema's own timezone are removed from the records written to the live
+    output files and appended to month-partitioned archives:
+
+        <output_dir>/archive/showtimes-2025-11.ndjson.gz
+
+    Each run appends a new gzip member, so writes never rewrite history. The
+    same showtime can be appended more than once (re-runs, --resume); compact()
+    merges the members of each month and removes duplicates.
+    """
+
+    def __init__(self, output_dir: str, archive_dir: str = None, now: Optional[datetime] = None):
+        """
+        Initialize archive
+
+        Args:
+            output_dir: Directory holding the output files
+            archive_dir: Where archive files are written (default: <output_dir>/ARCHIVE_DIR)
+            now: Cutoff; showtimes before it are archived (defaults to current
+                 time; a naive value is taken as the host's local time)
+        """
+        self.archive_dir = archive_dir or os.path.join(output_dir, main_config.ARCHIVE_DIR)
+        self.now = (now or datetime.now()).astimezone()
+        self.pending: List[Dict[str, Any]] = []
+        self._seen = set()
+        self.stats = Counter()
+
+    # ------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------
+    def cutoff(self, timezone: str) -> Tuple[str, str]:
+        """(date, time) of "now" on the wall clock of a cinema's timezone"""
+        local = self.now.astimezone(ZoneInfo(timezone))
+        return local.strftime('%Y-%m-%d'), local.strftime('%H:%M')
+
+    def retain(self, records: List[MovieRecord], timezone: str) -> List[MovieRecord]:
+        """
+        Drop past showtimes from records (queued for archiving)
+
+        Args:
+            records: Processed records of one cinema
+            timezone: The cinema's IANA timezone (showtimes are local to it)
+
+        Returns:
+            Records that still have upcoming showtimes
+        """
+        cutoff = self.cutoff(timezone)
+        live = []
+        for record in records:
+            upcoming = []
+            for showtime in record.showtimes:
+                if (showtime.show_date, showtime.show_time) >= cutoff:
+                    upcoming.append(showtime)
+                else:
+                    self._queue({
+                        "show_date": showtime.show_date,
+                        "show_time": showtime.show_time,
+                        "cinema_id": record.cinema_id,
+                        "film_id": record.film_id,
+                        "title": record.title,
+                        "year": record.year,
+                        "url": record.url,
+                        "scraped_at": record.scraped_at
+                    })
+            record.showtimes = upcoming
+            if upcoming:
+                live.append(record)
+            else:
+                self.stats['records_dropped'] += 1
+        return live
+
+    def retain_previous(self, previous_data: Optional[List[Dict[str, Any]]], timezone: str):
+        """
+        Queue past showtimes of a previously saved output file
+
+        Showtimes that were upcoming at the last run but have passed since
+        are no longer listed by the cinema, so this is the only place they
+        can be archived from.
+
+        Args:
+            previous_data: Last saved output of one cinema
+            timezone: The cinema's IANA timezone
+        """
+        cutoff = self.cutoff(timezone)
+        for item in previous_data or []:
+            movie = item.get('movie', {})
+            for showtime in item.get('showtimes', []):
+                if (showtime['show_date'], showtime['show_time']) < cutoff:
+                    self._queue({
+                        "show_date": showtime['show_date'],
+                        "show_time": showtime['show_time'],
+                        "cinema_id": item.get('cinema_id'),
+                        "film_id": item.get('film_id'),
+                        "title": movie.get('title'),
+                        "year": movie.get('year'),
+                        "url": movie.get('url'),
+                        "scraped_at": item.get('scraped_at')
+                    })
+
+    def flush(self) -> int:
+        """
+        Append queued showtimes to their monthly archive files
+
+        Returns:
+            Number of showtimes written
+        """
+        if not self.pending:
+            return 0
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.pending:
+            by_month.setdefault(row["show_date"][:7], []).append(row)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        for month, rows in sorted(by_month.items()):
+            rows.sort(key=archive_key)
+            with gzip.open(self.month_path(month), 'at', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+        written = len(self.pending)
+        self.stats['archived'] += written
+        self.pending = []
+        return written
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    # ------------------------------------------------------------
+    # Reading and compaction
+    # ------------------------------------------------------------
+    def month_path(self, month: str) -> str:
+        return os.path.join(self.archive_dir, f"showtimes-{month}.ndjson.gz")
+
+    def archive_files(self) -> List[str]:
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(
+            os.path.join(self.archive_dir, name) for name in os.listdir(self.archive_dir)
+            if name.startswith('showtimes-') and name.endswith('.ndjson.gz')
+        )
+
+    @staticmethod
+    def read_rows(path: str) -> Iterator[Dict[str, Any]]:
+        """Rows of one archive file (all gzip members)"""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def compact(self) -> Dict[str, Dict[str, int]]:
+        """
+        Merge each monthly archive into a single sorted, deduplicated member
+
+        Returns:
+            Per file: rows before and after compaction
+        """
+        results = {}
+        for path in self.archive_files():
+            rows = {}
+            before = 0
+            for row in self.read_rows(path):
+                before += 1
+                # Later rows win (they carry the most recent film_id/url)
+                rows[archive_key(row)] = {field: row.get(field) for field in ARCHIVE_FIELDS}
+
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                for key in sorted(rows):
+                    f.write(json.dumps(rows[key], ensure_ascii=False, separators=(',', ':')) + '\n')
+            os.replace(tmp_path, path)
+            results[os.path.basename(path)] = {"before": before, "after": len(rows)}
+        return results
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    def _queue(self, row: Dict[str, Any]):
+        key = archive_key(row)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.pending.append(row)
@@ -0,0 +1,283 @@
+"""
+Title Index - Persistent mapping of scraped titles to IMDb IDs
+
+Titles are stored normalized (see film_identity.normalize_title), so
+"Room, The", "The Room" and "The Room (2003)" share one entry. A lookup
+accepts years within TITLE_YEAR_TOLERANCE of the stored one, follows
+aliases, and prefers manual mappings over ones learned from OMDb.
+Enrichment fetched for an IMDb ID is kept with its fetch time, so a later
+run can skip OMDb entirely while it is fresh.
+
+Usage (from the scraper/ folder):
+    python -m common.title_index stats
+    python -m common.title_index show "room"
+    python -m common.title_index set "The Room" 2003 tt0368226
+    python -m common.title_index alias "Le Samourai" "The Samurai"
+    python -m common.title_index remove "The Room" --year 2003
+"""
+
+import argparse
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import main_config
+from common.film_identity import normalize_title
+
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TitleIndex:
+    """
+    Normalized title (+ year) -> IMDb ID, with aliases and cached enrichment
+
+    Safe to share between enrichment worker threads.
+
+    File layout (data/title_index.json):
+        {
+            "titles": {
+                "the room": [
+                    {"imdb_id": "tt0368226", "year": 2003, "source": "omdb",
+                     "resolved_at": "2025-11-01T06:14:37"}
+                ]
+            },
+            "aliases": {"le samourai": "the samurai"},
+            "enrichment": {
+                "tt0368226": {"fetched_at": "2025-11-01T06:14:37", "data": {...}}
+            }
+        }
+    """
+
+    def __init__(self, output_dir: str = None, path: str = None, now: Optional[datetime] = None):
+        """
+        Initialize index
+
+        Args:
+            output_dir: Directory holding the output files (index goes here)
+            path: Explicit index file (overrides output_dir)
+            now: Reference time for freshness (defaults to current time)
+        """
+        if path is None:
+            output_dir = output_dir or os.path.join(SCRAPER_DIR, main_config.OUTPUT_DIR)
+            path = os.path.join(output_dir, main_config.TITLE_INDEX_FILE)
+        self.path = path
+        self.now = now or datetime.now()
+        self.year_tolerance = main_config.TITLE_YEAR_TOLERANCE
+        self.max_age = timedelta(days=main_config.ENRICHMENT_MAX_AGE_DAYS)
+        self.stats = Counter()
+        # Enrichment workers share the index; every read and update holds this
+        self._lock = threading.RLock()
+
+        self.data = {"titles": {}, "aliases": {}, "enrichment": {}}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"    Title index: Ignoring unreadable {self.path}: {e}")
+
+    # ------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------
+    def lookup(self, title: str, year: Optional[int] = None) -> Optional[str]:
+        """
+        IMDb ID for a scraped title, or None
+
+        Manual mappings win over learned ones; among those, the closest
+        year within the tolerance wins. Without a year, a title with a
+        single mapping resolves to it.
+        """
+        with self._lock:
+            self.stats['lookups'] += 1
+            entry = self._best_entry(self._canonical(title), year)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return entry["imdb_id"]
+
+    def fresh_enrichment(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+        """Stored enrichment for an IMDb ID if fetched within ENRICHMENT_MAX_AGE_DAYS"""
+        with self._lock:
+            cached = self.data["enrichment"].get(imdb_id)
+            if not cached:
+                return None
+            if self.now - datetime.fromisoformat(cached["fetched_at"]) > self.max_age:
+                return None
+            self.stats['fresh'] += 1
+            return cached["data"]
+
+    # ------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------
+    def record(self, title: str, year: Optional[int], imdb_id: str, source: str = "omdb"):
+        """
+        Remember that a title (with its real release year) is imdb_id
+
+        Learned mappings never replace a manual one for the same year.
+        """
+        with self._lock:
+            key = self._canonical(title)
+            if not key or not imdb_id:
+                return
+            entries = self.data["titles"].setdefault(key, [])
+            for entry in entries:
+                if entry["year"] == year:
+                    if entry["source"] == "manual" and source != "manual":
+                        return
+                    entries.remove(entry)
+                    break
+            entries.append({
+                "imdb_id": imdb_id,
+                "year": year,
+                "source": source,
+                "resolved_at": self.now.isoformat(timespec='seconds')
+            })
+            entries.sort(key=lambda e: (e["year"] is None, e["year"] or 0))
+            self.stats['recorded'] += 1
+
+    def store_enrichment(self, imdb_id: str, enrichment: Dict[str, Any]):
+        if imdb_id:
+            with self._lock:
+                self.data["enrichment"][imdb_id] = {
+                    "fetched_at": self.now.isoformat(timespec='seconds'),
+                    "data": enrichment
+                }
+
+    def add_alias(self, alias: str, title: str):
+        """Treat alias as another name of title"""
+        with self._lock:
+            self.data["aliases"][normalize_title(alias)] = normalize_title(title)
+
+    def remove(self, title: str, year: Optional[int] = None) -> int:
+        """
+        Forget the mappings of a title (only the given year, if any)
+
+        Returns:
+            Number of mappings removed
+        """
+        with self._lock:
+            key = self._canonical(title)
+            entries = self.data["titles"].get(key, [])
+            kept = [e for e in entries if year is not None and e["year"] != year]
+            if kept:
+                self.data["titles"][key] = kept
+            else:
+                self.data["titles"].pop(key, None)
+            return len(entries) - len(kept)
+
+    def find(self, query: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Mappings whose normalized title contains the normalized query"""
+        needle = normalize_title(query)
+        with self._lock:
+            return {key: entries for key, entries in sorted(self.data["titles"].items()) if needle in key}
+
+    def save(self):
+        """Write the index"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and this run's hit rate"""
+        with self._lock:
+            lookups = self.stats['lookups']
+            return {
+                "titles": len(self.data["titles"]),
+                "aliases": len(self.data["aliases"]),
+                "lookups": lookups,
+                "hits": self.stats['hits'],
+                "fresh": self.stats['fresh'],
+                "hit_rate": round(self.stats['hits'] / lookups, 3) if lookups else None
+            }
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    def _canonical(self, title: str) -> str:
+        key = normalize_title(title)
+        return self.data["aliases"].get(key, key)
+
+    def _best_entry(self, key: str, year: Optional[int]) -> Optional[Dict[str, Any]]:
+        entries = self.data["titles"].get(key, [])
+        if year is None or not entries:
+            return entries[0] if len(entries) == 1 else None
+
+        candidates = [
+            e for e in entries
+            if e["year"] is None or abs(e["year"] - year) <= self.year_tolerance
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda e: (
+            e["source"] != "manual",
+            abs((e["year"] or year) - year)
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect and correct the title -> IMDb ID index')
+    parser.add_argument('--file', help='Index file (default: data/title_index.json)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('stats', help='Index size')
+
+    show = commands.add_parser('show', help='Mappings whose title contains QUERY')
+    show.add_argument('query')
+
+    lookup = commands.add_parser('lookup', help='Resolve a title as the scraper would')
+    lookup.add_argument('title')
+    lookup.add_argument('year', type=int, nargs='?')
+
+    set_cmd = commands.add_parser('set', help='Map a title/year to an IMDb ID (manual, wins over OMDb)')
+    set_cmd.add_argument('title')
+    set_cmd.add_argument('year', type=int)
+    set_cmd.add_argument('imdb_id')
+
+    alias = commands.add_parser('alias', help='Make ALIAS resolve like TITLE')
+    alias.add_argument('alias')
+    alias.add_argument('title')
+
+    remove = commands.add_parser('remove', help='Forget the mappings of a title')
+    remove.add_argument('title')
+    remove.add_argument('--year', type=int)
+
+    args = parser.parse_args()
+    index = TitleIndex(path=args.file)
+
+    if args.command == 'stats':
+        stats = index.get_stats()
+        cached = len(index.data["enrichment"])
+        print(f"{stats['titles']} titles, {stats['aliases']} aliases, {cached} cached enrichments")
+    elif args.command == 'show':
+        matches = index.find(args.query)
+        for key, entries in matches.items():
+            for entry in entries:
+                print(f"{key!r:40} {entry['year'] or '----'}  {entry['imdb_id']:<11} {entry['source']}")
+        if not matches:
+            print("No matches")
+    elif args.command == 'lookup':
+        print(index.lookup(args.title, args.year) or "Not in index")
+    elif args.command == 'set':
+        index.record(args.title, args.year, args.imdb_id, source="manual")
+        index.save()
+        print(f"✓ {normalize_title(args.title)!r} ({args.year}) -> {args.imdb_id}")
+    elif args.command == 'alias':
+        index.add_alias(args.alias, args.title)
+        index.save()
+        print(f"✓ {normalize_title(args.alias)!r} -> {normalize_title(args.title)!r}")
+    elif args.command == 'remove':
+        removed = index.remove(args.title, args.year)
+        index.save()
+        print(f"✓ Removed {removed} mapping(s)")
+
+
+if __name__ == "__main__":
+    main()
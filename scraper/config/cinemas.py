@@ -9,6 +9,8 @@ CINEMAS = {
         "base_url": "https://www.siff.net",
         "days_to_scrape": [0, 1, 2, 3, 4, 5, 6],  # 0 = today, 6 = 6 days from now
         "output_file": "siff_movies.json",
+        "timezone": "America/Los_Angeles",  # Showtimes are listed in this local time
+        "fetch": "selenium",  # "selenium" (browser) or "http" (async, no JavaScript)
         "venues": {
             "SIFF Cinema Uptown": "SIFF_UPTOWN",
             "SIFF Cinema Downtown": "SIFF_DOWNTOWN",
@@ -22,6 +24,8 @@ CINEMAS = {
         "base_url": "https://www.viff.org",
         "days_to_scrape": [0, 1, 2, 3, 4, 5, 6],
         "output_file": "viff_movies.json",
+        "timezone": "America/Vancouver",
+        "fetch": "selenium",
         "venues": {
             "The Centre": "VIFF_CENTRE",
             "International Village": "VIFF_INTERNATIONAL_VILLAGE",
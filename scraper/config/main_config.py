@@ -12,6 +12,23 @@ OMDB_API_KEY = os.getenv('OMDB_API_KEY', 'b574d469')  # Fallback for local dev
 OMDB_API_URL = "http://www.omdbapi.com/"  # OMDb API endpoint
 USE_OMDB_ENRICHMENT = True  # Set to False to disable OMDb enrichment
 
+# OMDb request scheduling
+OMDB_DAILY_BUDGET = 1000  # Calls per day (free tier limit)
+OMDB_TIMEOUT = 10  # Seconds per request
+OMDB_MAX_RETRIES = 3  # Retries for timeouts / connection errors / 5xx
+OMDB_BACKOFF_BASE = 1.0  # Seconds, doubled per retry (with jitter)
+OMDB_BACKOFF_MAX = 30.0  # Cap for a single backoff delay
+OMDB_BREAKER_THRESHOLD = 5  # Consecutive failures before OMDb is skipped for the run
+OMDB_REQUEST_DELAY = 0.3  # Seconds between OMDb calls
+
+# Pipelined enrichment: OMDb lookups start while later days are still being scraped
+USE_PIPELINED_ENRICHMENT = True  # Set to False to enrich only after scraping finishes
+ENRICHMENT_WORKERS = 2  # Threads consuming the lookup queue (calls still paced by OMDB_REQUEST_DELAY)
+
+# Title -> IMDb ID index (data/title_index.json)
+TITLE_YEAR_TOLERANCE = 1  # Scraped years this far from OMDb's still match
+ENRICHMENT_MAX_AGE_DAYS = 7  # Indexed enrichment younger than this is reused without a call
+
 # ============================================================
 # Scraper Settings
 # ============================================================
@@ -22,19 +39,62 @@ ENABLED_SCRAPERS = ["siff", "viff"]  # Options: "siff", "viff"
 REQUEST_DELAY = 1  # Seconds between requests (be polite!)
 PAGE_LOAD_WAIT = 3  # Seconds to wait for JavaScript to load
 
+# Adaptive refresh scheduling (--schedule adaptive, --watch)
+REFRESH_ALWAYS_DAYS = 2  # Day indices below this are fetched every run (today, tomorrow)
+REFRESH_BASE_INTERVAL_HOURS = 24  # Refresh interval after one unchanged fetch (doubles per unchanged fetch)
+REFRESH_MAX_INTERVAL_HOURS = 96  # Longest a day may go without a refresh
+REFRESH_TIME_BUDGET_SECONDS = 60  # Per-cinema time budget for fetching days
+REFRESH_HISTORY_LENGTH = 14  # Fetch outcomes kept per day in metadata.json
+WATCH_INTERVAL_MINUTES = 30  # Polling interval for --watch
+
+# Plain HTTP cinemas (cinemas.py "fetch": "http"), fetched concurrently with aiohttp
+ASYNC_MAX_CONNECTIONS = 20  # Connection pool size across all hosts
+ASYNC_PER_HOST_LIMIT = 4  # Concurrent requests per host
+ASYNC_TIMEOUT = 20  # Seconds per request
+ASYNC_RETRIES = 2  # Retries for timeouts / connection errors / 5xx
+ASYNC_REQUEST_DELAY = 0.25  # Seconds a host slot is held after each request
+ASYNC_PARSE_WORKERS = 2  # Processes parsing HTML (0 = parse in a thread)
+
 # Selenium settings
 USE_HEADLESS = True  # Run browser in headless mode
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# Poster pipeline (downloads posters, serves local thumbnails)
+USE_POSTER_PIPELINE = True  # Set to False to keep hot-linking remote posters
+POSTER_DOWNLOAD_WORKERS = 8  # Concurrent poster downloads
+POSTER_THUMBNAIL_WORKERS = 2  # Processes used to build thumbnails
+POSTER_THUMBNAIL_WIDTH = 342  # Pixels
+POSTER_THUMBNAIL_FORMAT = "webp"  # "webp" or "jpeg"
+POSTER_TIMEOUT = 15  # Seconds per download
+
+# Film identity resolution (same film across cinemas / title spellings)
+USE_FILM_RESOLUTION = True  # Set to False to treat every (title, year) as its own film
+FILM_MATCH_MIN_SIMILARITY = 0.85  # Title similarity needed for a non-exact match
+
 # ============================================================
 # Output Settings
 # ============================================================
 # Output directory (relative to scraper/ folder)
 OUTPUT_DIR = "../data"
 
+# Checkpoints for --resume (relative to scraper/ folder, not committed)
+CHECKPOINT_DIR = ".checkpoints"
+
+# Past showtimes are moved out of the live files into monthly archives
+USE_SHOWTIME_RETENTION = True  # Set to False to keep past showtimes in the output files
+ARCHIVE_DIR = "archive"  # Relative to OUTPUT_DIR: archive/showtimes-YYYY-MM.ndjson.gz
+
+# Poster storage (relative to scraper/ folder)
+POSTER_CACHE_DIR = ".cache/posters"  # Content-addressed originals (not committed)
+POSTER_THUMBNAIL_DIR = "../public/posters"  # Thumbnails served by the website
+POSTER_PUBLIC_PATH = "/posters"  # URL path of POSTER_THUMBNAIL_DIR on the website
+
 # Output filenames
 COMBINED_OUTPUT_FILE = "movies.json"  # All cinemas combined
+FILMS_OUTPUT_FILE = "films.json"  # All cinemas, one entry per film with its screenings
 METADATA_FILE = "metadata.json"  # Scraping metadata
+POSTER_MANIFEST_FILE = "posters.json"  # Poster URL -> content hash / thumbnail
+TITLE_INDEX_FILE = "title_index.json"  # Normalized title -> IMDb ID, cached enrichment
 
 # ============================================================
 # Logging
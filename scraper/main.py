@@ -2,14 +2,27 @@
 Main Script - Orchestrates all cinema scrapers
 """
 
+import asyncio
+import contextlib
 import json
 import os
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from config import main_config, cinemas
-from scrapers.siff.scraper import SIFFScraper
+from common.omdb_scheduler import OMDbScheduler
+from common.checkpoint import CheckpointStore
+from common.refresh_scheduler import RefreshScheduler, SCHEDULE_MODES
+from common.records import to_dicts
+from common.poster_pipeline import PosterPipeline
+from common.film_identity import FilmResolver, group_by_film
+from common.showtime_archive import ShowtimeArchive
+from common.title_index import TitleIndex
+from common.async_base_scraper import AsyncHTTPClient
+from scrapers.siff.scraper import SIFFScraper, SIFFHTTPScraper
 from scrapers.siff.processor import SIFFProcessor
 # from scrapers.viff.scraper import VIFFScraper
 # from scrapers.viff.processor import VIFFProcessor
@@ -32,13 +45,135 @@ def save_json(data: Any, filename: str, output_dir: str) -> str:
     return filepath
 
 
-def run_scraper(scraper_name: str, output_dir: str) -> Dict[str, Any]:
+def load_json(filename: str, output_dir: str) -> Optional[Any]:
+    """Load a previously saved JSON file, or None if missing/unreadable"""
+    filepath = os.path.join(output_dir, filename)
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not read {filepath}: {e}")
+        return None
+
+
+def get_scraper(scraper_name: str):
+    """Create the scraper for a cinema (no browser is started until a page is fetched)"""
+    if scraper_name == "siff":
+        return SIFFHTTPScraper() if uses_http(scraper_name) else SIFFScraper()
+    # elif scraper_name == "viff":
+    #     return VIFFScraper()
+    raise ValueError(f"Unknown scraper: {scraper_name}")
+
+
+def uses_http(scraper_name: str) -> bool:
+    """Whether a cinema is fetched with the async HTTP client instead of Selenium"""
+    return cinemas.get_cinema_config(scraper_name).get('fetch') == "http"
+
+
+def start_scrape(
+    scraper_name: str,
+    history: Dict[str, Any],
+    resume: bool = False,
+    schedule: str = "full"
+) -> Tuple[Any, CheckpointStore, RefreshScheduler]:
+    """Create the scraper, checkpoint store and refresh plan for one cinema"""
+    scraper = get_scraper(scraper_name)
+    
+    # Checkpoints let an interrupted run be resumed
+    checkpoint = CheckpointStore(scraper_name, resume=resume)
+    if checkpoint.resumed:
+        print(f"↺ Resuming {scraper_name.upper()} run {checkpoint.run_id}")
+    
+    # Decide which days need fetching
+    refresh = RefreshScheduler(history=history, mode=schedule)
+    return scraper, checkpoint, refresh
+
+
+async def scrape_http_cinemas(
+    scraper_names: List[str],
+    resume: bool = False,
+    schedule: str = "full",
+    previous_metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Scrape all HTTP cinemas concurrently in one event loop with one shared client
+    
+    Returns:
+        Per cinema: {"scraper", "checkpoint", "refresh", "raw_data", "error"}
+    """
+    previous_cinemas = (previous_metadata or {}).get("cinemas") or {}
+    
+    async with AsyncHTTPClient() as client:
+        async def scrape(scraper_name: str) -> Dict[str, Any]:
+            prefetched = {"error": None, "raw_data": []}
+            try:
+                history = (previous_cinemas.get(scraper_name) or {}).get("days", {})
+                scraper, checkpoint, refresh = start_scrape(scraper_name, history, resume, schedule)
+                prefetched.update(scraper=scraper, checkpoint=checkpoint, refresh=refresh)
+                prefetched["raw_data"] = await scraper.scrape_all_days_async(
+                    client, checkpoint=checkpoint, refresh=refresh
+                )
+            except Exception as e:
+                prefetched["error"] = e
+            return prefetched
+        
+        scraped = await asyncio.gather(*(scrape(name) for name in scraper_names))
+        if main_config.VERBOSE:
+            stats = client.get_stats()
+            print(f"  HTTP: {stats.get('requests', 0)} pages, {stats.get('retries', 0)} retries, "
+                  f"{stats.get('failed', 0)} failed")
+    
+    return dict(zip(scraper_names, scraped))
+
+
+def get_processor(
+    scraper_name: str,
+    omdb_scheduler: Optional[OMDbScheduler] = None,
+    film_resolver: Optional[FilmResolver] = None,
+    title_index: Optional[TitleIndex] = None
+):
+    """Create the processor for a cinema"""
+    if scraper_name == "siff":
+        return SIFFProcessor(
+            omdb_scheduler=omdb_scheduler,
+            film_resolver=film_resolver,
+            title_index=title_index
+        )
+    # elif scraper_name == "viff":
+    #     return VIFFProcessor()
+    raise ValueError(f"Unknown scraper: {scraper_name}")
+
+
+def run_scraper(
+    scraper_name: str,
+    output_dir: str,
+    omdb_scheduler: Optional[OMDbScheduler] = None,
+    resume: bool = False,
+    schedule: str = "full",
+    previous_metadata: Optional[Dict[str, Any]] = None,
+    poster_pipeline: Optional[PosterPipeline] = None,
+    film_resolver: Optional[FilmResolver] = None,
+    showtime_archive: Optional[ShowtimeArchive] = None,
+    title_index: Optional[TitleIndex] = None,
+    prefetched: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Run a specific scraper
     
     Args:
         scraper_name: Name of scraper (e.g., "siff", "viff")
         output_dir: Output directory path
+        omdb_scheduler: Shared OMDb scheduler so all cinemas draw from one daily budget
+        resume: Reuse days and OMDb lookups finished by the previous (interrupted) run
+        schedule: Refresh mode - "full", "adaptive" or "watch" (see RefreshScheduler)
+        previous_metadata: Last metadata.json, source of the per-day change history
+        poster_pipeline: If given, posters are downloaded and linked as local thumbnails
+        film_resolver: Shared resolver so films get the same film_id in every cinema
+        showtime_archive: If given, past showtimes are moved from the output to the archive
+        title_index: Shared title -> IMDb ID index used for OMDb lookups
+        prefetched: Output of scrape_http_cinemas for this cinema (skips scraping)
         
     Returns:
         Result dictionary with status and data
@@ -51,27 +186,50 @@ def run_scraper(scraper_name: str, output_dir: str) -> Dict[str, Any]:
         "scraped_at": datetime.now().isoformat()
     }
     
+    # Keep the day history even if this run fails
+    previous_cinema = ((previous_metadata or {}).get("cinemas") or {}).get(scraper_name) or {}
+    result["days"] = previous_cinema.get("days", {})
+    
     try:
         print(f"\n{'='*60}")
         print(f"▶ RUNNING {scraper_name.upper()} SCRAPER")
         print(f"{'='*60}")
         
-        # Get scraper and processor
-        if scraper_name == "siff":
-            scraper = SIFFScraper()
-            processor = SIFFProcessor()
-        # elif scraper_name == "viff":
-        #     scraper = VIFFScraper()
-        #     processor = VIFFProcessor()
-        else:
-            raise ValueError(f"Unknown scraper: {scraper_name}")
-        
-        # Get cinema config
+        # Get processor and cinema config
+        processor = get_processor(scraper_name, omdb_scheduler, film_resolver, title_index)
         cinema_config = cinemas.get_cinema_config(scraper_name)
+        previous_data = load_json(cinema_config['output_file'], output_dir)
+        # Watch polls only re-check showtimes; OMDb refreshes are left to full runs
+        refresh_enrichment = schedule != "watch"
         
         # Step 1: Scrape raw data
         print("\n📥 SCRAPING...")
-        raw_data = scraper.scrape_all_days()
+        pipeline = None
+        if prefetched:
+            # Already fetched over HTTP while earlier cinemas were running
+            if prefetched["error"]:
+                raise prefetched["error"]
+            scraper, refresh = prefetched["scraper"], prefetched["refresh"]
+            checkpoint = prefetched["checkpoint"]
+            raw_data = prefetched["raw_data"]
+        else:
+            scraper, checkpoint, refresh = start_scrape(scraper_name, result["days"], resume, schedule)
+            # OMDb lookups for each day's new titles run while later days are scraped
+            pipeline = processor.start_enrichment(previous_data, checkpoint, refresh_enrichment)
+            with pipeline or contextlib.nullcontext():
+                raw_data = scraper.scrape_all_days(
+                    checkpoint=checkpoint,
+                    refresh=refresh,
+                    on_day=processor.queue_enrichment if pipeline else None
+                )
+        result["days"] = refresh.get_history()
+        result["refresh"] = refresh.get_stats()
+        if pipeline:
+            result["pipeline"] = pipeline.get_stats()
+            stats = result["pipeline"]
+            print(f"✓ {stats['looked_up']} OMDb lookups done while scraping "
+                  f"(queue max {stats['max_queue_depth']}, waited {stats['drain_seconds']}s after scraping, "
+                  f"workers idle {stats['worker_idle_seconds']}s)")
         
         if not raw_data:
             print(f"⚠️  No data scraped from {scraper_name.upper()}")
@@ -82,7 +240,12 @@ def run_scraper(scraper_name: str, output_dir: str) -> Dict[str, Any]:
         
         # Step 2: Process data
         print("\n⚙️  PROCESSING...")
-        processed_data = processor.process_movies(raw_data)
+        processed_data = processor.process_movies(
+            raw_data,
+            previous_data=previous_data,
+            checkpoint=checkpoint,
+            refresh_enrichment=refresh_enrichment
+        )
         
         if not processed_data:
             print(f"⚠️  No data processed from {scraper_name.upper()}")
@@ -91,15 +254,32 @@ def run_scraper(scraper_name: str, output_dir: str) -> Dict[str, Any]:
         
         print(f"✓ Processed {len(processed_data)} movies")
         
+        # Past showtimes (this scrape's and the last output's) go to the archive
+        if showtime_archive:
+            showtime_archive.retain_previous(previous_data, cinema_config['timezone'])
+            processed_data = showtime_archive.retain(processed_data, cinema_config['timezone'])
+        
+        # Posters are optional - a failure here must not lose the scrape
+        if poster_pipeline:
+            print("\n🖼  POSTERS...")
+            try:
+                poster_pipeline.run(processed_data)
+            except Exception as e:
+                print(f"⚠️  Poster pipeline failed: {e}")
+        
         # Step 3: Save cinema-specific file
         output_file = cinema_config['output_file']
-        filepath = save_json(processed_data, output_file, output_dir)
+        filepath = save_json(to_dicts(processed_data), output_file, output_dir)
         print(f"\n💾 Saved to: {filepath}")
+        if showtime_archive:
+            result["archived"] = showtime_archive.flush()
+            print(f"🗄  Archived {result['archived']} past showtimes")
         
         # Update result
         result["status"] = "success"
         result["movie_count"] = len(processed_data)
         result["data"] = processed_data
+        result["parse_failures"] = dict(processor.parse_failures)
         
         # Cleanup
         scraper.cleanup()
@@ -115,8 +295,113 @@ def run_scraper(scraper_name: str, output_dir: str) -> Dict[str, Any]:
     return result
 
 
+def reprocess_scraper(
+    scraper_name: str,
+    output_dir: str,
+    omdb_scheduler: Optional[OMDbScheduler] = None,
+    previous_metadata: Optional[Dict[str, Any]] = None,
+    poster_pipeline: Optional[PosterPipeline] = None,
+    film_resolver: Optional[FilmResolver] = None,
+    showtime_archive: Optional[ShowtimeArchive] = None,
+    title_index: Optional[TitleIndex] = None
+) -> Dict[str, Any]:
+    """
+    Re-run processing and output for a cinema from its saved raw snapshots
+    
+    Nothing is scraped. OMDb data from the current output file and the last
+    run's checkpointed lookups is reused, so only titles that have never been
+    looked up trigger an OMDb request.
+    
+    Args:
+        scraper_name: Name of scraper (e.g., "siff", "viff")
+        output_dir: Output directory path
+        omdb_scheduler: Shared OMDb scheduler
+        previous_metadata: Last metadata.json (day history is carried over)
+        poster_pipeline: If given, known thumbnails are linked (nothing is downloaded)
+        film_resolver: Shared resolver so films get the same film_id in every cinema
+        showtime_archive: If given, past showtimes are moved from the output to the archive
+        title_index: Shared title -> IMDb ID index used for OMDb lookups
+        
+    Returns:
+        Result dictionary with status and data
+    """
+    result = {
+        "scraper": scraper_name,
+        "status": "failed",
+        "movie_count": 0,
+        "error": None,
+        "scraped_at": datetime.now().isoformat()
+    }
+    
+    previous_cinema = ((previous_metadata or {}).get("cinemas") or {}).get(scraper_name) or {}
+    result["days"] = previous_cinema.get("days", {})
+    if previous_cinema.get("last_scraped"):
+        result["scraped_at"] = previous_cinema["last_scraped"]
+    
+    try:
+        print(f"\n{'='*60}")
+        print(f"▶ REPROCESSING {scraper_name.upper()}")
+        print(f"{'='*60}")
+        
+        processor = get_processor(scraper_name, omdb_scheduler, film_resolver, title_index)
+        cinema_config = cinemas.get_cinema_config(scraper_name)
+        
+        # resume=True opens the existing checkpoint without starting a new run
+        checkpoint = CheckpointStore(scraper_name, resume=True)
+        raw_data = checkpoint.load_all_snapshots(from_date=datetime.now().strftime('%Y-%m-%d'))
+        
+        if not raw_data:
+            print(f"⚠️  No saved raw data for {scraper_name.upper()} in {checkpoint.days_dir}")
+            result["status"] = "no_data"
+            return result
+        
+        print(f"✓ Loaded {len(raw_data)} raw entries from snapshots")
+        
+        print("\n⚙️  PROCESSING...")
+        previous_data = load_json(cinema_config['output_file'], output_dir)
+        processed_data = processor.process_movies(
+            raw_data,
+            previous_data=previous_data,
+            checkpoint=checkpoint,
+            refresh_enrichment=False
+        )
+        
+        if not processed_data:
+            print(f"⚠️  No data processed from {scraper_name.upper()}")
+            result["status"] = "no_data"
+            return result
+        
+        print(f"✓ Processed {len(processed_data)} movies")
+        
+        if showtime_archive:
+            showtime_archive.retain_previous(previous_data, cinema_config['timezone'])
+            processed_data = showtime_archive.retain(processed_data, cinema_config['timezone'])
+        
+        if poster_pipeline:
+            poster_pipeline.apply(processed_data)
+        
+        filepath = save_json(to_dicts(processed_data), cinema_config['output_file'], output_dir)
+        print(f"\n💾 Saved to: {filepath}")
+        if showtime_archive:
+            result["archived"] = showtime_archive.flush()
+            print(f"🗄  Archived {result['archived']} past showtimes")
+        
+        result["status"] = "success"
+        result["movie_count"] = len(processed_data)
+        result["data"] = processed_data
+        result["parse_failures"] = dict(processor.parse_failures)
+        
+    except Exception as e:
+        print(f"\n❌ Error reprocessing {scraper_name.upper()}: {e}")
+        import traceback
+        traceback.print_exc()
+        result["error"] = str(e)
+    
+    return result
+
+
 def generate_combined_output(results: List[Dict[str, Any]], output_dir: str):
-    """Generate combined movies.json with all cinemas"""
+    """Generate combined movies.json and films.json (screenings grouped by film) with all cinemas"""
     all_movies = []
     
     for result in results:
@@ -125,16 +410,28 @@ def generate_combined_output(results: List[Dict[str, Any]], output_dir: str):
     
     if all_movies:
         filepath = save_json(
-            all_movies,
+            to_dicts(all_movies),
             main_config.COMBINED_OUTPUT_FILE,
             output_dir
         )
         print(f"\n💾 Combined output saved to: {filepath}")
+        
+        films = group_by_film(all_movies)
+        filepath = save_json(films, main_config.FILMS_OUTPUT_FILE, output_dir)
+        print(f"💾 {len(films)} films saved to: {filepath}")
     
     return all_movies
 
 
-def generate_metadata(results: List[Dict[str, Any]], total_movies: int, output_dir: str):
+def generate_metadata(
+    results: List[Dict[str, Any]],
+    total_movies: int,
+    output_dir: str,
+    omdb_scheduler: Optional[OMDbScheduler] = None,
+    poster_pipeline: Optional[PosterPipeline] = None,
+    film_resolver: Optional[FilmResolver] = None,
+    title_index: Optional[TitleIndex] = None
+):
     """Generate metadata.json with scraping info"""
     metadata = {
         "last_updated": datetime.now().isoformat(),
@@ -142,6 +439,18 @@ def generate_metadata(results: List[Dict[str, Any]], total_movies: int, output_d
         "cinemas": {}
     }
     
+    if omdb_scheduler:
+        metadata["omdb"] = omdb_scheduler.get_stats()
+    
+    if poster_pipeline and poster_pipeline.get_stats():
+        metadata["posters"] = poster_pipeline.get_stats()
+    
+    if film_resolver:
+        metadata["films"] = film_resolver.get_stats()
+    
+    if title_index:
+        metadata["title_index"] = title_index.get_stats()
+    
     for result in results:
         scraper_name = result["scraper"]
         metadata["cinemas"][scraper_name] = {
@@ -151,6 +460,16 @@ def generate_metadata(results: List[Dict[str, Any]], total_movies: int, output_d
         }
         if result.get("error"):
             metadata["cinemas"][scraper_name]["error"] = result["error"]
+        if result.get("parse_failures"):
+            metadata["cinemas"][scraper_name]["parse_failures"] = result["parse_failures"]
+        if result.get("refresh"):
+            metadata["cinemas"][scraper_name]["refresh"] = result["refresh"]
+        if result.get("pipeline"):
+            metadata["cinemas"][scraper_name]["pipeline"] = result["pipeline"]
+        if result.get("archived"):
+            metadata["cinemas"][scraper_name]["archived"] = result["archived"]
+        if result.get("days"):
+            metadata["cinemas"][scraper_name]["days"] = result["days"]
     
     filepath = save_json(metadata, main_config.METADATA_FILE, output_dir)
     print(f"💾 Metadata saved to: {filepath}")
@@ -158,43 +477,115 @@ def generate_metadata(results: List[Dict[str, Any]], total_movies: int, output_d
     return metadata
 
 
-def main():
-    """Main execution function"""
+def compact_archive(output_dir: str):
+    """Merge and deduplicate the monthly showtime archives"""
+    archive = ShowtimeArchive(output_dir)
+    results = archive.compact()
+    if not results:
+        print(f"No archives in {archive.archive_dir}")
+    for filename, counts in results.items():
+        removed = counts["before"] - counts["after"]
+        print(f"🗄  {filename}: {counts['after']} showtimes ({removed} duplicates removed)")
+    return results
+
+
+def run_all(
+    scrapers_to_run: List[str],
+    output_dir: str,
+    resume: bool = False,
+    schedule: str = "full",
+    reprocess: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the given scrapers once and write combined output and metadata
     
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Cinema Showtime Scraper')
-    parser.add_argument(
-        '--scrapers',
-        nargs='+',
-        choices=cinemas.get_all_cinema_names(),
-        help='Specific scrapers to run (e.g., --scrapers siff viff)'
-    )
-    args = parser.parse_args()
+    Args:
+        scrapers_to_run: Scraper names
+        output_dir: Output directory path
+        resume: Resume the previous (interrupted) run
+        schedule: Refresh mode passed to each scraper
+        reprocess: Rebuild outputs from saved raw snapshots instead of scraping
+        
+    Returns:
+        Generated metadata
+    """
+    previous_metadata = load_json(main_config.METADATA_FILE, output_dir)
     
-    # Determine which scrapers to run
-    scrapers_to_run = args.scrapers if args.scrapers else main_config.ENABLED_SCRAPERS
+    # One OMDb scheduler for the whole run, continuing today's call count
+    omdb_scheduler = None
+    title_index = None
+    if main_config.USE_OMDB_ENRICHMENT:
+        omdb_scheduler = OMDbScheduler.from_metadata(previous_metadata)
+        title_index = TitleIndex(output_dir)
+        print(f"OMDb budget: {omdb_scheduler.remaining}/{omdb_scheduler.daily_budget} calls left today")
     
-    # Print header
-    print("\n" + "="*60)
-    print("🎬 CINEMA SHOWTIME SCRAPER")
-    print("="*60)
-    print(f"Scrapers to run: {', '.join(scrapers_to_run).upper()}")
-    print(f"OMDb enrichment: {'ENABLED' if main_config.USE_OMDB_ENRICHMENT else 'DISABLED'}")
-    print("="*60)
+    poster_pipeline = PosterPipeline(output_dir) if main_config.USE_POSTER_PIPELINE else None
     
-    # Ensure output directory exists
-    output_dir = ensure_output_dir()
+    # One resolver for the whole run, so a film shared by cinemas is enriched once
+    film_resolver = FilmResolver() if main_config.USE_FILM_RESOLUTION else None
+    
+    # Live files keep upcoming showtimes only; past ones are archived
+    showtime_archive = ShowtimeArchive(output_dir) if main_config.USE_SHOWTIME_RETENTION else None
+    
+    # HTTP cinemas are fetched in one event loop in the background while the
+    # Selenium cinemas run; they are processed last, once their pages are in
+    known = [name for name in scrapers_to_run if name in cinemas.get_all_cinema_names()]
+    http_names = [] if reprocess else [name for name in known if uses_http(name)]
+    http_scrape = None
+    if http_names:
+        print(f"Fetching over HTTP in the background: {', '.join(http_names).upper()}")
+        http_executor = ThreadPoolExecutor(max_workers=1)
+        http_scrape = http_executor.submit(
+            asyncio.run, scrape_http_cinemas(http_names, resume, schedule, previous_metadata)
+        )
+        http_executor.shutdown(wait=False)
     
     # Run each scraper
     results = []
-    for scraper_name in scrapers_to_run:
-        if scraper_name not in cinemas.get_all_cinema_names():
+    for scraper_name in [n for n in scrapers_to_run if n not in http_names] + http_names:
+        if scraper_name not in known:
             print(f"\n⚠️  Unknown scraper: {scraper_name}")
             continue
         
-        result = run_scraper(scraper_name, output_dir)
+        prefetched = None
+        if scraper_name in http_names:
+            try:
+                prefetched = http_scrape.result()[scraper_name]
+            except Exception as e:
+                prefetched = {"error": e}
+        
+        if reprocess:
+            result = reprocess_scraper(
+                scraper_name,
+                output_dir,
+                omdb_scheduler,
+                previous_metadata,
+                poster_pipeline=poster_pipeline,
+                film_resolver=film_resolver,
+                showtime_archive=showtime_archive,
+                title_index=title_index
+            )
+        else:
+            result = run_scraper(
+                scraper_name,
+                output_dir,
+                omdb_scheduler,
+                resume=resume,
+                schedule=schedule,
+                previous_metadata=previous_metadata,
+                poster_pipeline=poster_pipeline,
+                film_resolver=film_resolver,
+                showtime_archive=showtime_archive,
+                title_index=title_index,
+                prefetched=prefetched
+            )
         results.append(result)
     
+    if poster_pipeline and not reprocess:
+        poster_pipeline.save()
+    if title_index:
+        title_index.save()
+    
     # Generate combined output
     print(f"\n{'='*60}")
     print("📦 GENERATING COMBINED OUTPUT")
@@ -203,20 +594,125 @@ def main():
     all_movies = generate_combined_output(results, output_dir)
     
     # Generate metadata
-    metadata = generate_metadata(results, len(all_movies), output_dir)
+    metadata = generate_metadata(
+        results, len(all_movies), output_dir, omdb_scheduler, poster_pipeline, film_resolver, title_index
+    )
     
     # Print final summary
     print(f"\n{'='*60}")
     print("📊 FINAL SUMMARY")
     print(f"{'='*60}")
     print(f"Total movies across all cinemas: {len(all_movies)}")
+    if film_resolver:
+        print(f"Distinct films: {film_resolver.get_stats()['films']}")
     
     for result in results:
         status_icon = "✅" if result["status"] == "success" else "❌"
         print(f"{status_icon} {result['scraper'].upper()}: {result['movie_count']} movies ({result['status']})")
+        if result.get("refresh") and result["refresh"]["mode"] != "full":
+            refresh = result["refresh"]
+            print(f"   Days fetched: {refresh['fetched']} ({refresh['changed']} changed), reused: {refresh['reused']}")
+    
+    if omdb_scheduler:
+        stats = omdb_scheduler.get_stats()
+        print(f"OMDb: {stats['calls_this_run']} calls, {stats['calls_skipped']} skipped")
+        if stats['circuit_open']:
+            print(f"⚠️  OMDb circuit breaker open: {stats['circuit_reason']}")
+    if title_index:
+        stats = title_index.get_stats()
+        if stats['lookups']:
+            print(f"Title index: {stats['hits']}/{stats['lookups']} hits, {stats['fresh']} served without a call")
+    
+    return metadata
+
+
+def main():
+    """Main execution function"""
+    
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Cinema Showtime Scraper')
+    parser.add_argument(
+        '--scrapers',
+        nargs='+',
+        choices=cinemas.get_all_cinema_names(),
+        help='Specific scrapers to run (e.g., --scrapers siff viff)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume the last run, skipping days and OMDb lookups it already finished'
+    )
+    parser.add_argument(
+        '--reprocess',
+        action='store_true',
+        help='Skip scraping; rebuild output files from the last saved raw snapshots'
+    )
+    parser.add_argument(
+        '--compact-archive',
+        action='store_true',
+        help='Merge and deduplicate the monthly showtime archives, then exit'
+    )
+    parser.add_argument(
+        '--schedule',
+        choices=[mode for mode in SCHEDULE_MODES if mode != "watch"],
+        default="full",
+        help='Day refresh mode: "full" fetches every day, "adaptive" skips days that rarely change'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running, re-polling near-term days every WATCH_INTERVAL_MINUTES'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=main_config.WATCH_INTERVAL_MINUTES,
+        help='Minutes between --watch polls'
+    )
+    args = parser.parse_args()
+    
+    if args.compact_archive:
+        compact_archive(ensure_output_dir())
+        return
+    
+    # Determine which scrapers to run
+    scrapers_to_run = args.scrapers if args.scrapers else main_config.ENABLED_SCRAPERS
+    
+    # Print header
+    print("\n" + "="*60)
+    print("🎬 CINEMA SHOWTIME SCRAPER")
+    print("="*60)
+    print(f"Scrapers to run: {', '.join(scrapers_to_run).upper()}")
+    print(f"OMDb enrichment: {'ENABLED' if main_config.USE_OMDB_ENRICHMENT else 'DISABLED'}")
+    if args.reprocess:
+        print("Mode: REPROCESS (no scraping)")
+    else:
+        print(f"Schedule: {'WATCH' if args.watch else args.schedule.upper()}")
+    print("="*60)
     
-    print(f"\n✅ Scraping completed!")
-    print(f"Output directory: {output_dir}")
+    # Ensure output directory exists
+    output_dir = ensure_output_dir()
+    
+    if args.reprocess:
+        run_all(scrapers_to_run, output_dir, reprocess=True)
+        print(f"\n✅ Reprocessing completed!")
+        print(f"Output directory: {output_dir}")
+        return
+    
+    if not args.watch:
+        run_all(scrapers_to_run, output_dir, resume=args.resume, schedule=args.schedule)
+        print(f"\n✅ Scraping completed!")
+        print(f"Output directory: {output_dir}")
+        return
+    
+    # Watch mode: the first pass follows --schedule, later passes only re-poll near-term days
+    schedule = args.schedule
+    resume = args.resume
+    while True:
+        run_all(scrapers_to_run, output_dir, resume=resume, schedule=schedule)
+        schedule, resume = "watch", False
+        print(f"\n⏱  Next poll in {args.watch_interval:g} minutes (Ctrl+C to stop)")
+        time.sleep(args.watch_interval * 60)
 
 
 if __name__ == "__main__":
@@ -227,4 +723,4 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
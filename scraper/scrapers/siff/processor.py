@@ -2,51 +2,85 @@
 SIFF Processor - Process SIFF scraped data
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from collections import defaultdict
-import time
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from common.base_processor import BaseProcessor
 from common.omdb_client import OMDbClient
+from common.omdb_scheduler import OMDbScheduler
+from common.checkpoint import CheckpointStore
+from common.records import RawEntry, Showtime, MovieRecord
+from common.film_identity import FilmResolver, TitleFacts
+from common.enrichment_pipeline import EnrichmentPipeline
+from common.title_index import TitleIndex
 from config import main_config, cinemas
 
+# Fields produced by the scraper and poster pipeline; everything else in "movie" comes from OMDb
+BASE_MOVIE_FIELDS = (
+    "title", "url", "image_url", "country", "year", "duration", "director",
+    "image_thumbnail", "poster_thumbnail"
+)
+
 
 class SIFFProcessor(BaseProcessor):
     """Process SIFF movie data"""
     
-    def __init__(self, use_omdb: bool = None):
+    def __init__(
+        self,
+        use_omdb: bool = None,
+        omdb_scheduler: Optional[OMDbScheduler] = None,
+        film_resolver: Optional[FilmResolver] = None,
+        title_index: Optional[TitleIndex] = None
+    ):
         config = cinemas.get_cinema_config("siff")
         super().__init__(cinema_venues=config['venues'])
         self.use_omdb = use_omdb if use_omdb is not None else main_config.USE_OMDB_ENRICHMENT
-        self.omdb_client = OMDbClient() if self.use_omdb else None
+        self.omdb_client = OMDbClient(scheduler=omdb_scheduler, title_index=title_index) if self.use_omdb else None
+        self.film_resolver = film_resolver
+        self.pipeline = None
     
-    def group_by_movie_and_venue(self, raw_data: List[Dict[str, Any]]) -> Dict[tuple, List[Dict[str, Any]]]:
+    def group_by_movie_and_venue(self, raw_data: List[RawEntry]) -> Dict[tuple, List[RawEntry]]:
         """Group raw data by (title, venue) combination"""
         grouped = defaultdict(list)
         
         for entry in raw_data:
-            key = (entry['title'], entry['venue'])
+            key = (entry.title, entry.venue)
             grouped[key].append(entry)
         
         return grouped
     
-    def process_movies(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def process_movies(
+        self,
+        raw_data: List[RawEntry],
+        previous_data: Optional[List[Dict[str, Any]]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh_enrichment: bool = True
+    ) -> List[MovieRecord]:
         """
         Transform raw scraped data into final format
         
         Args:
             raw_data: List of raw movie entries from scraper
+            previous_data: Last saved output for this cinema, used to prioritize
+                           OMDb lookups and as fallback when OMDb is unavailable
+            checkpoint: If given, OMDb results are saved per title as they finish
+                        and titles finished earlier in this run are not looked up
+            refresh_enrichment: If False, titles with previous OMDb data reuse it
+                                without a new lookup
             
         Returns:
-            List of processed movie objects
+            List of processed movie records (convert with to_dict() to save)
         """
         # Group by (title, venue)
         grouped = self.group_by_movie_and_venue(raw_data)
         
+        # Parse every distinct showtime/metadata string once
+        times, metadata = self.normalize_batch(raw_data)
+        
         if main_config.VERBOSE:
             print(f"  Grouped into {len(grouped)} unique movie-venue combinations")
             if self.use_omdb:
@@ -55,11 +89,11 @@ class SIFFProcessor(BaseProcessor):
         processed_movies = []
         scraped_at = datetime.now().strftime('%Y-%m-%d')
         
-        for idx, ((title, venue), entries) in enumerate(grouped.items(), 1):
+        for (title, venue), entries in grouped.items():
             first_entry = entries[0]
             
             # Parse metadata
-            parsed_meta = self.parse_metadata(first_entry['metadata'])
+            parsed_meta = metadata[first_entry.metadata]
             
             # Get cinema ID
             cinema_id = self.get_cinema_id(venue) if venue else "SIFF_UNKNOWN"
@@ -67,58 +101,235 @@ class SIFFProcessor(BaseProcessor):
             # Collect all showtimes
             showtimes = []
             for entry in entries:
-                show_date = entry['show_date']
-                for time_str in entry['showtimes']:
-                    time_24h = self.convert_time_to_24h(time_str)
+                show_date = entry.show_date
+                for time_str in entry.showtimes:
+                    time_24h = times[time_str]
                     if time_24h:
-                        showtimes.append({
-                            "show_date": show_date,
-                            "show_time": time_24h
-                        })
+                        showtimes.append(Showtime(show_date, time_24h))
             
-            # Sort showtimes
-            showtimes.sort(key=lambda x: (x['show_date'], x['show_time']))
+            # Sort showtimes (tuples sort by date, then time)
+            showtimes.sort()
             
-            # Build movie object
-            movie_obj = {
-                "movie": {
-                    "title": title,
-                    "url": first_entry['url'],
-                    "image_url": first_entry['image_url'],
-                    "country": parsed_meta['country'],
-                    "year": parsed_meta['year'],
-                    "duration": parsed_meta['duration'],
-                    "director": parsed_meta['director']
-                },
-                "cinema_id": cinema_id,
-                "showtimes": showtimes,
-                "scraped_at": scraped_at
-            }
+            # Build movie record
+            movie_obj = MovieRecord(
+                title=title,
+                url=first_entry.url,
+                image_url=first_entry.image_url,
+                country=parsed_meta['country'],
+                year=parsed_meta['year'],
+                duration=parsed_meta['duration'],
+                director=parsed_meta['director'],
+                cinema_id=cinema_id,
+                showtimes=showtimes,
+                scraped_at=scraped_at
+            )
             
-            # Enrich with OMDb
-            if self.use_omdb:
-                if main_config.VERBOSE:
-                    print(f"  [{idx}/{len(grouped)}] Processing: {title} @ {cinema_id}")
-                
-                omdb_data = self.omdb_client.search_by_title_year(
-                    title=title,
-                    year=parsed_meta['year']
+            if main_config.VERBOSE and not self.use_omdb:
+                print(f"  ✓ Processed: {title} @ {cinema_id} ({len(showtimes)} showtimes)")
+            
+            processed_movies.append(movie_obj)
+        
+        if self.parse_failures and main_config.VERBOSE:
+            failures = ', '.join(f"{count} {kind}" for kind, count in sorted(self.parse_failures.items()))
+            print(f"  ⚠ Unparseable values: {failures}")
+        
+        # Give records of the same film (any venue or cinema) a shared film_id
+        if self.film_resolver:
+            self.film_resolver.assign(processed_movies)
+            if main_config.VERBOSE:
+                films = len({movie_obj.film_id for movie_obj in processed_movies})
+                print(f"  Resolved {len(processed_movies)} records to {films} films")
+        
+        # Enrich with OMDb
+        if self.use_omdb:
+            self.enrich_movies(processed_movies, previous_data, checkpoint, refresh_enrichment)
+        
+        return processed_movies
+    
+    def start_enrichment(
+        self,
+        previous_data: Optional[List[Dict[str, Any]]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh_enrichment: bool = True
+    ) -> Optional[EnrichmentPipeline]:
+        """
+        Pipeline that looks titles up while the scraper is still running
+        
+        Run scraping inside it (`with`) and pass queue_enrichment as the
+        scraper's on_day callback; process_movies then uses its results.
+        Titles enrich_movies would not look up are never queued, and titles
+        without previous data are looked up first. Each answered lookup is
+        checkpointed as soon as it finishes, so --resume keeps it.
+        
+        Args:
+            Same as process_movies
+            
+        Returns:
+            The pipeline, or None if OMDb or pipelining is disabled
+        """
+        if not self.use_omdb or not main_config.USE_PIPELINED_ENRICHMENT:
+            return None
+        
+        self._previous = self.previous_enrichments(previous_data)
+        self._skip = set(checkpoint.load_enrichments()) if checkpoint else set()
+        if not refresh_enrichment:
+            self._skip |= set(self._previous)
+        self._queued = set()
+        # Spellings of one film seen so far, so only the first is looked up
+        self._queued_films = FilmResolver()
+        
+        def lookup(key: tuple) -> Optional[Dict[str, Any]]:
+            enrichment = self.omdb_client.get_enrichment(*key)
+            # Only real answers are checkpointed; skipped/failed calls get retried
+            if checkpoint and self.omdb_client.is_cached(*key):
+                checkpoint.save_enrichment(*key, enrichment)
+            return enrichment
+        
+        self.pipeline = EnrichmentPipeline(lookup)
+        return self.pipeline
+    
+    def queue_enrichment(self, entries: List[RawEntry]):
+        """Queue OMDb lookups for the new titles of one scraped day (producer side)"""
+        for entry in entries:
+            parsed, _ = self._lookup_metadata(entry.metadata)
+            key = (entry.title, parsed['year'])
+            if key in self._queued:
+                continue
+            self._queued.add(key)
+            
+            same_film = False
+            if self.film_resolver:
+                facts = TitleFacts.from_fields(entry.title, parsed['year'], parsed['director'], parsed['duration'])
+                known = len(self._queued_films.films)
+                self._queued_films.resolve(facts)
+                shared = self.film_resolver.match(facts)
+                same_film = (
+                    len(self._queued_films.films) == known
+                    or (shared is not None and shared.film_id in self.film_resolver.enrichments)
                 )
-                
-                if omdb_data:
-                    enrichment = self.omdb_client.extract_enrichment_data(omdb_data)
-                    movie_obj['movie'].update(enrichment)
-                    if main_config.VERBOSE:
-                        print(f"    ✓ Enriched (IMDb: {enrichment.get('imdb_rating', 'N/A')})")
-                else:
-                    if main_config.VERBOSE:
-                        print(f"    ⚠ No OMDb data")
-                
-                time.sleep(0.3)
+            
+            if key in self._skip or same_film:
+                self.pipeline.stats['skipped'] += 1
+                continue
+            self.pipeline.submit(key, priority=1 if key in self._previous else 0)
+    
+    def enrich_movies(
+        self,
+        processed_movies: List[MovieRecord],
+        previous_data: Optional[List[Dict[str, Any]]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh_enrichment: bool = True
+    ):
+        """
+        Add OMDb data to processed movies in place
+        
+        Each film is looked up once, under the (title, year) of its first record
+        (or of the record the pipeline already looked up, see start_enrichment);
+        without a film resolver every distinct (title, year) is its own film.
+        Films already enriched for another cinema this run are not looked up
+        again. Films without previously saved enrichment are looked up first so
+        that, when the daily budget or the circuit breaker cuts the run short,
+        only refreshes are lost - those keep their previous enrichment.
+        
+        Args:
+            processed_movies: Output of the grouping step
+            previous_data: Last saved output for this cinema
+            checkpoint: Optional store for per-title results
+            refresh_enrichment: Look up titles that already have previous data
+        """
+        previous = self.previous_enrichments(previous_data)
+        finished = checkpoint.load_enrichments() if checkpoint else {}
+        shared = self.film_resolver.enrichments if self.film_resolver else {}
+        
+        # Results looked up while scraping
+        prefetched = self.pipeline.results if self.pipeline else {}
+        
+        # Lookup key and all member keys per film
+        films = {}
+        for movie_obj in processed_movies:
+            films.setdefault(movie_obj.identity, []).append(movie_obj.key)
+        lookup_keys = {
+            identity: next((key for key in keys if key in prefetched), keys[0])
+            for identity, keys in films.items()
+        }
+        previous_by_film = {
+            identity: next((previous[key] for key in keys if key in previous), None)
+            for identity, keys in films.items()
+        }
+        
+        scheduler = self.omdb_client.scheduler
+        if not refresh_enrichment:
+            finished = {
+                **{lookup_keys[i]: data for i, data in previous_by_film.items() if data},
+                **finished
+            }
+        ordered = scheduler.prioritize(list(films), is_cached=lambda i: previous_by_film[i] is not None)
+        
+        enrichments = {}
+        for idx, identity in enumerate(ordered, 1):
+            title, year = lookup_keys[identity]
+            if identity in shared:
+                if shared[identity]:
+                    enrichments[identity] = shared[identity]
+                continue
+            if (title, year) in finished:
+                if finished[(title, year)]:
+                    enrichments[identity] = finished[(title, year)]
+                continue
+            
+            if (title, year) in prefetched:
+                enrichment = prefetched[(title, year)]
             else:
                 if main_config.VERBOSE:
-                    print(f"  ✓ Processed: {title} @ {cinema_id} ({len(showtimes)} showtimes)")
+                    print(f"  [{idx}/{len(ordered)}] Looking up: {title} ({year})")
+                enrichment = self.omdb_client.get_enrichment(title, year)
             
-            processed_movies.append(movie_obj)
+            # Only real answers are checkpointed/shared; skipped/failed calls get retried
+            if self.omdb_client.is_cached(title, year):
+                # Pipeline results were checkpointed by the worker already
+                if checkpoint and (title, year) not in prefetched:
+                    checkpoint.save_enrichment(title, year, enrichment)
+                if self.film_resolver:
+                    shared[identity] = enrichment
+            
+            if enrichment:
+                enrichments[identity] = enrichment
+                if main_config.VERBOSE:
+                    imdb_rating = (enrichment.get('ratings') or {}).get('imdb_rating', 'N/A')
+                    print(f"    ✓ Enriched (IMDb: {imdb_rating})")
+            elif previous_by_film[identity]:
+                enrichments[identity] = previous_by_film[identity]
+                if main_config.VERBOSE:
+                    print(f"    ↺ Kept previous OMDb data")
+            else:
+                if main_config.VERBOSE:
+                    print(f"    ⚠ No OMDb data")
+        
+        for movie_obj in processed_movies:
+            if movie_obj.identity in enrichments:
+                movie_obj.enrichment.update(enrichments[movie_obj.identity])
         
-        return processed_movies
\ No newline at end of file
+        if main_config.VERBOSE:
+            if finished:
+                print(f"  Reused {len(finished)} OMDb results without a new lookup")
+            if prefetched:
+                print(f"  {len(prefetched)} OMDb lookups were done while scraping")
+            stats = scheduler.get_stats()
+            print(f"  OMDb calls: {stats['calls_this_run']} this run, "
+                  f"{stats['calls_skipped']} skipped, {scheduler.remaining} left today")
+    
+    @staticmethod
+    def previous_enrichments(previous_data: Optional[List[Dict[str, Any]]]) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Extract OMDb fields from a previously saved output
+        
+        Returns:
+            Mapping of (title, year) to the enrichment fields saved last run
+        """
+        enrichments = {}
+        for movie_obj in previous_data or []:
+            movie = movie_obj.get('movie', {})
+            enrichment = {k: v for k, v in movie.items() if k not in BASE_MOVIE_FIELDS}
+            if enrichment:
+                enrichments[(movie.get('title'), movie.get('year'))] = enrichment
+        return enrichments
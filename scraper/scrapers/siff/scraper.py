@@ -3,12 +3,16 @@ SIFF Scraper - Seattle International Film Festival
 """
 
 import time
-from typing import List, Dict, Any
+from typing import Callable, List, Optional
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from common.base_scraper import BaseScraper
+from common.async_base_scraper import AsyncBaseScraper
+from common.checkpoint import CheckpointStore
+from common.refresh_scheduler import RefreshScheduler
+from common.records import RawEntry
 from config import main_config, cinemas
 
 
@@ -22,8 +26,9 @@ class SIFFScraper(BaseScraper):
             base_url=config['base_url']
         )
         self.config = config
+        self.failed_days = set()
     
-    def scrape_movies_for_day(self, day_index: int) -> List[Dict[str, Any]]:
+    def scrape_movies_for_day(self, day_index: int) -> List[RawEntry]:
         """
         Scrape movie listings for a specific day
         
@@ -31,9 +36,8 @@ class SIFFScraper(BaseScraper):
             day_index: 0-6 (0=today, 1=tomorrow, etc.)
             
         Returns:
-            List of raw movie data dictionaries
+            List of raw movie entries
         """
-        movies = []
         url = f"{self.base_url}?day={day_index}#now"
         
         try:
@@ -41,106 +45,31 @@ class SIFFScraper(BaseScraper):
                 print(f"  Fetching day {day_index}...")
             
             html_content = self.fetch_page(url)
-            soup = self.parse_html(html_content)
-            
-            # Extract the date from button
-            button_group = soup.find('div', class_='button-group')
-            date_text = 'Unknown'
-            if button_group:
-                active_button = button_group.find('a', class_='button on')
-                if active_button:
-                    date_text = active_button.get_text(strip=True)
-            
-            # Calculate actual date
-            actual_date = self.calculate_date(day_index)
-            
-            # Find the "Now Playing" section
-            listing_section = soup.find('div', class_='listing thumbs')
-            
-            if not listing_section:
-                if main_config.VERBOSE:
-                    print(f"    No movies found for day {day_index}")
-                return movies
-            
-            # Find all movie items
-            movie_elements = listing_section.find_all('div', class_='item')
-            if main_config.VERBOSE:
-                print(f"    Found {len(movie_elements)} movies for {date_text}")
-            
-            for movie in movie_elements:
-                try:
-                    # Extract title
-                    title_elem = movie.find('h3')
-                    title = title_elem.get_text(strip=True) if title_elem else None
-                    
-                    if not title:
-                        continue
-                    
-                    # Extract URL
-                    title_link = title_elem.find('a') if title_elem else None
-                    movie_url = title_link['href'] if title_link and title_link.get('href') else None
-                    if movie_url and not movie_url.startswith('http'):
-                        movie_url = self.base_url + movie_url
-                    
-                    # Extract image
-                    img_elem = movie.find('img')
-                    image_url = img_elem['src'] if img_elem and img_elem.get('src') else None
-                    if image_url and not image_url.startswith('http'):
-                        image_url = self.base_url + image_url
-                    
-                    # Extract metadata
-                    meta_elem = movie.find('p', class_='meta')
-                    metadata = meta_elem.get_text(strip=True) if meta_elem else ''
-                    
-                    # Extract venue and showtimes
-                    times_section = movie.find('div', class_='times')
-                    venue = None
-                    showtimes = []
-                    
-                    if times_section:
-                        venue_elem = times_section.find('h3')
-                        if venue_elem:
-                            venue_link = venue_elem.find('span', class_='dark-gray-text')
-                            venue = venue_link.get_text(strip=True) if venue_link else None
-                        
-                        # Extract all showtime buttons
-                        showtime_buttons = times_section.find_all('a', class_='button')
-                        for btn in showtime_buttons:
-                            time_text = btn.get_text(strip=True)
-                            if time_text and ('PM' in time_text or 'AM' in time_text):
-                                showtimes.append(time_text)
-                    
-                    # Create raw movie data entry
-                    movie_data = {
-                        'title': title,
-                        'url': movie_url,
-                        'image_url': image_url,
-                        'metadata': metadata,
-                        'venue': venue,
-                        'showtimes': showtimes,
-                        'show_date': actual_date,
-                        'day_index': day_index,
-                        'date_text': date_text
-                    }
-                    
-                    movies.append(movie_data)
-                    
-                except Exception as e:
-                    if main_config.VERBOSE:
-                        print(f"    Error parsing movie: {e}")
-                    continue
+            return parse_listing(html_content, day_index, self.calculate_date(day_index), self.base_url)
                     
         except Exception as e:
             print(f"    Error scraping day {day_index}: {e}")
+            self.failed_days.add(day_index)
         
-        return movies
+        return []
     
-    def scrape_all_days(self, days: List[int] = None) -> List[Dict[str, Any]]:
+    def scrape_all_days(
+        self,
+        days: List[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        refresh: Optional[RefreshScheduler] = None,
+        on_day: Optional[Callable[[List[RawEntry]], None]] = None
+    ) -> List[RawEntry]:
         """
         Scrape movie listings for multiple days
         
         Args:
             days: List of day indices. If None, uses config
+            checkpoint: If given, finished days are saved as they complete and
+                        days already finished by this run are not fetched again
+            refresh: If given (requires checkpoint), only the days it plans are
+                     fetched; the rest are served from their last snapshot
+            on_day: Called with each day's entries as soon as they are available
             
         Returns:
             List of all raw movie data
@@ -148,11 +77,169 @@ class SIFFScraper(BaseScraper):
         if days is None:
             days = self.config['days_to_scrape']
         
+        to_fetch = set(days)
+        if refresh and checkpoint:
+            to_fetch = set(refresh.plan(days, self.calculate_date, checkpoint.has_snapshot))
+            if main_config.VERBOSE and refresh.mode != "full":
+                print(f"  Refresh plan ({refresh.mode}): fetching days {sorted(to_fetch)}")
+        
         all_movies = []
         
         for day in days:
+            show_date = self.calculate_date(day)
+            
+            if checkpoint:
+                saved = checkpoint.load_day(show_date)
+                if saved is None and day not in to_fetch:
+                    saved = checkpoint.load_snapshot(show_date)
+                    if saved is not None and refresh:
+                        refresh.record_reuse(show_date)
+                if saved is not None:
+                    if main_config.VERBOSE:
+                        print(f"  Day {day} ({show_date}): {len(saved)} entries from checkpoint")
+                    saved = [entry._replace(day_index=day) for entry in saved]
+                    all_movies.extend(saved)
+                    if on_day:
+                        on_day(saved)
+                    continue
+            
+            started = time.monotonic()
             movies = self.scrape_movies_for_day(day)
+            duration = time.monotonic() - started
             all_movies.extend(movies)
+            if on_day:
+                on_day(movies)
+            
+            # Failed days are left unsaved so --resume retries them
+            if day not in self.failed_days:
+                if checkpoint:
+                    checkpoint.save_day(day, show_date, movies)
+                if refresh:
+                    changed = refresh.record_fetch(show_date, movies, duration)
+                    if main_config.VERBOSE:
+                        print(f"    {'Changed' if changed else 'Unchanged'} since last fetch")
+            
             time.sleep(main_config.REQUEST_DELAY)
         
-        return all_movies
\ No newline at end of file
+        return all_movies
+
+
+class SIFFHTTPScraper(AsyncBaseScraper):
+    """SIFF listing fetched over plain HTTP (cinemas.py "fetch": "http")"""
+    
+    def __init__(self, base_url: str = None):
+        super().__init__(cinemas.get_cinema_config("siff"), base_url=base_url)
+    
+    def day_url(self, day_index: int) -> str:
+        return f"{self.base_url}?day={day_index}"
+    
+    @staticmethod
+    def parse_day(html_content: str, day_index: int, show_date: str, base_url: str) -> List[RawEntry]:
+        return parse_listing(html_content, day_index, show_date, base_url)
+
+
+def parse_listing(html_content: str, day_index: int, show_date: str, base_url: str) -> List[RawEntry]:
+    """
+    Parse one day of the SIFF listing page
+    
+    Module-level so it can run in a worker process (see SIFFHTTPScraper).
+    
+    Args:
+        html_content: Page HTML
+        day_index: 0-6 (0=today, 1=tomorrow, etc.)
+        show_date: Date of day_index (YYYY-MM-DD)
+        base_url: Prefix for relative links
+        
+    Returns:
+        List of raw movie entries
+    """
+    from bs4 import BeautifulSoup
+    
+    movies = []
+    soup = BeautifulSoup(html_content, 'html.parser')
+    
+    # Extract the date from button
+    button_group = soup.find('div', class_='button-group')
+    date_text = 'Unknown'
+    if button_group:
+        active_button = button_group.find('a', class_='button on')
+        if active_button:
+            date_text = active_button.get_text(strip=True)
+    
+    # Find the "Now Playing" section
+    listing_section = soup.find('div', class_='listing thumbs')
+    
+    if not listing_section:
+        if main_config.VERBOSE:
+            print(f"    No movies found for day {day_index}")
+        return movies
+    
+    # Find all movie items
+    movie_elements = listing_section.find_all('div', class_='item')
+    if main_config.VERBOSE:
+        print(f"    Found {len(movie_elements)} movies for {date_text}")
+    
+    for movie in movie_elements:
+        try:
+            # Extract title
+            title_elem = movie.find('h3')
+            title = title_elem.get_text(strip=True) if title_elem else None
+            
+            if not title:
+                continue
+            
+            # Extract URL
+            title_link = title_elem.find('a') if title_elem else None
+            movie_url = title_link['href'] if title_link and title_link.get('href') else None
+            if movie_url and not movie_url.startswith('http'):
+                movie_url = base_url + movie_url
+            
+            # Extract image
+            img_elem = movie.find('img')
+            image_url = img_elem['src'] if img_elem and img_elem.get('src') else None
+            if image_url and not image_url.startswith('http'):
+                image_url = base_url + image_url
+            
+            # Extract metadata
+            meta_elem = movie.find('p', class_='meta')
+            metadata = meta_elem.get_text(strip=True) if meta_elem else ''
+            
+            # Extract venue and showtimes
+            times_section = movie.find('div', class_='times')
+            venue = None
+            showtimes = []
+            
+            if times_section:
+                venue_elem = times_section.find('h3')
+                if venue_elem:
+                    venue_link = venue_elem.find('span', class_='dark-gray-text')
+                    venue = venue_link.get_text(strip=True) if venue_link else None
+                
+                # Extract all showtime buttons
+                showtime_buttons = times_section.find_all('a', class_='button')
+                for btn in showtime_buttons:
+                    time_text = btn.get_text(strip=True)
+                    if time_text and ('PM' in time_text or 'AM' in time_text):
+                        showtimes.append(time_text)
+            
+            # Create raw movie data entry
+            movie_data = RawEntry.create(
+                title=title,
+                url=movie_url,
+                image_url=image_url,
+                metadata=metadata,
+                venue=venue,
+                showtimes=showtimes,
+                show_date=show_date,
+                day_index=day_index,
+                date_text=date_text
+            )
+            
+            movies.append(movie_data)
+            
+        except Exception as e:
+            if main_config.VERBOSE:
+                print(f"    Error parsing movie: {e}")
+            continue
+    
+    return movies